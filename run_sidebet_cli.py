@@ -1,17 +1,21 @@
 #!/usr/bin/env python
 import argparse
 import os
-import json
+import logging
 import sys
 import time
 import csv
 from datetime import datetime
+from pathlib import Path
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 from src.simulation.config import SimulationConfig
 from src.simulation.sidebet_simulator import SidebetSimulator
 from src.reporting.report_generator import ReportGenerator
+from src.reporting.json_io import load_json, dump_json
+
+logger = logging.getLogger("sidebet_cli")
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -26,6 +30,9 @@ def parse_arguments():
     parser.add_argument('--reshuffle-threshold', type=int, default=52, help='Reshuffle threshold (cards remaining)')
     parser.add_argument('--continuous-shuffle', action='store_true', help='Use continuous shuffle')
     parser.add_argument('--hit-against-blackjack', action='store_true', help='Allow player to hit against dealer blackjack')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes to split the hands across (default: 1)')
+    parser.add_argument('--seed', type=int, help='Random seed (worker i uses seed + i)')
     
     # Sidebet specific options
     parser.add_argument('--payout-mode', choices=['total', 'cards'], default='total',
@@ -56,6 +63,7 @@ def parse_arguments():
     parser.add_argument('--config-dir', type=str, default='config', help='Directory to save configuration')
     parser.add_argument('--no-save', action='store_true', help='Do not save results to files')
     parser.add_argument('--config-file', type=str, help='Load configuration from file')
+    parser.add_argument('--quiet', action='store_true', help='Only print the house edges')
     
     return parser.parse_args()
 
@@ -63,13 +71,19 @@ def main():
     """Main entry point for the CLI application."""
     args = parse_arguments()
     
+    # Progress and breakdown output goes through the logger so --quiet skips formatting it
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format="%(message)s", stream=sys.stdout)
+    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_dir = Path(args.output_dir)
+    config_dir = Path(args.config_dir)
     
     if args.config_file:
-        with open(args.config_file, 'r') as f:
-            config_dict = json.load(f)
+        with open(args.config_file, 'rb') as f:
+            config_dict = load_json(f)
         sim_config = SimulationConfig.from_dict(config_dict)
-        print(f"Loaded configuration from {args.config_file}")
+        logger.info("Loaded configuration from %s", args.config_file)
     else:
         # Set up payouts based on mode
         if args.payout_mode == 'total':
@@ -109,54 +123,57 @@ def main():
         )
     
     if not args.no_save:
-        os.makedirs(args.config_dir, exist_ok=True)
-        config_file = f"{args.config_dir}/sidebet_config_cli_{timestamp}.json"
-        with open(config_file, "w") as f:
-            json.dump(sim_config.to_dict(), f, indent=4)
-        print(f"Configuration saved to {config_file}")
+        config_dir.mkdir(parents=True, exist_ok=True)
+        config_file = config_dir / f"sidebet_config_cli_{timestamp}.json"
+        with open(config_file, "wb") as f:
+            dump_json(sim_config.to_dict(), f)
+        logger.info("Configuration saved to %s", config_file)
     
     # Run the simulation
-    print(f"Running sidebet simulation with {args.num_hands} hands...")
-    simulator = SidebetSimulator(sim_config)
+    logger.info("Running sidebet simulation with %s hands...", args.num_hands)
+    simulator = SidebetSimulator(sim_config, seed=args.seed)
     start_time = time.time()
-    results = simulator.run_simulation()
+    results = simulator.run_simulation_parallel(args.workers, report_progress=not args.quiet)
     end_time = time.time()
     simulation_time = end_time - start_time
     
     # Print summary results
-    total_hands = results['total_bets']
-    total_pushes = results['total_pushes']
-    push_rate = total_pushes / total_hands * 100 if total_hands > 0 else 0
-    
-    print("\nSimulation Results Summary:")
-    print(f"Total hands: {total_hands}")
-    print(f"Simulation time: {simulation_time:.2f} seconds")
-    print(f"Total pushes: {total_pushes} ({push_rate:.2f}%)")
-    print(f"Player blackjacks: {results['player_blackjacks']} ({results['player_blackjacks']/total_hands*100:.2f}%)")
-    print(f"Dealer blackjacks: {results['dealer_blackjacks']} ({results['dealer_blackjacks']/total_hands*100:.2f}%)")
-    
-    # Print push breakdown by value
-    if args.payout_mode == 'total':
-        print("\nPush Breakdown by Hand Value:")
-        for value, count in results['pushes_by_value'].items():
-            percentage = count / total_pushes * 100 if total_pushes > 0 else 0
-            payout = sim_config.sidebet_payouts.get(value, 0) if isinstance(value, int) else sim_config.sidebet_payouts.get(str(value), 0)
-            print(f"{value}: {count} ({percentage:.2f}%) - Payout: {payout}:1")
-    else:
-        print("\nPush Breakdown by Card Count:")
-        for cards, count in results['pushes_by_card_count'].items():
-            percentage = count / total_pushes * 100 if total_pushes > 0 else 0
-            payout = sim_config.sidebet_payouts.get(cards, 0) if isinstance(cards, int) else sim_config.sidebet_payouts.get(str(cards), 0)
-            print(f"{cards} cards: {count} ({percentage:.2f}%) - Payout: {payout}:1")
+    if logger.isEnabledFor(logging.INFO):
+        total_hands = results['total_bets']
+        total_pushes = results['total_pushes']
+        push_rate = total_pushes / total_hands * 100 if total_hands > 0 else 0
+        
+        logger.info("\nSimulation Results Summary:")
+        logger.info("Total hands: %s", total_hands)
+        logger.info("Simulation time: %.2f seconds", simulation_time)
+        logger.info("Total pushes: %s (%.2f%%)", total_pushes, push_rate)
+        logger.info("Player blackjacks: %s (%.2f%%)", results['player_blackjacks'], results['player_blackjacks']/total_hands*100)
+        logger.info("Dealer blackjacks: %s (%.2f%%)", results['dealer_blackjacks'], results['dealer_blackjacks']/total_hands*100)
+        
+        # Payouts keyed the way the breakdown rows look them up: int keys as-is, anything else by its string form
+        payout_lookup = {key if isinstance(key, int) else str(key): payout for key, payout in sim_config.sidebet_payouts.items()}
+        
+        # Print push breakdown by value
+        if args.payout_mode == 'total':
+            logger.info("\nPush Breakdown by Hand Value:")
+            for value, count in results['pushes_by_value'].items():
+                percentage = count / total_pushes * 100 if total_pushes > 0 else 0
+                logger.info("%s: %s (%.2f%%) - Payout: %s:1", value, count, percentage, payout_lookup.get(value, 0))
+        else:
+            logger.info("\nPush Breakdown by Card Count:")
+            for cards, count in results['pushes_by_card_count'].items():
+                percentage = count / total_pushes * 100 if total_pushes > 0 else 0
+                logger.info("%s cards: %s (%.2f%%) - Payout: %s:1", cards, count, percentage, payout_lookup.get(cards, 0))
     
     # Print house edge
     print(f"\nSidebet House Edge: {results['sidebet_edge']:.2f}%")
     print(f"Main Bet House Edge: {results['house_edge']:.2f}%")
     
     if not args.no_save:
-        os.makedirs(args.output_dir, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
         
-        report_generator = ReportGenerator(simulator)
+        # The saved files are listed through the logger below, so the generator stays silent
+        report_generator = ReportGenerator(simulator, verbose=False)
 
         summary_file = f"sidebet_sim_summary_cli_{timestamp}.txt"
         detailed_file = f"sidebet_sim_detailed_cli_{timestamp}.csv"
@@ -168,58 +185,47 @@ def main():
         report_generator.generate_outcome_matrix_csv(matrix_file)
         
         # Generate the detailed push matrix CSV
-        generate_detailed_push_matrix_csv(results, os.path.join(args.output_dir, push_matrix_file))
+        generate_detailed_push_matrix_csv(results, output_dir / push_matrix_file)
         
-        print(f"\nResults have been saved to the following files:")
-        print(f"- Summary: {args.output_dir}/{summary_file}")
-        print(f"- Detailed CSV: {args.output_dir}/{detailed_file}")
-        print(f"- Matrix CSV: {args.output_dir}/{matrix_file}")
-        print(f"- Detailed Push Matrix: {args.output_dir}/{push_matrix_file}")
+        logger.info("\nResults have been saved to the following files:")
+        logger.info("- Summary: %s", output_dir / summary_file)
+        logger.info("- Detailed CSV: %s", output_dir / detailed_file)
+        logger.info("- Matrix CSV: %s", output_dir / matrix_file)
+        logger.info("- Detailed Push Matrix: %s", output_dir / push_matrix_file)
 
 def generate_detailed_push_matrix_csv(results, filepath):
     """Generate a CSV file with detailed push statistics correlating hand total and card count"""
     if not results or 'pushes_detail_matrix' not in results:
         raise ValueError("No push detail matrix available in the results")
     
-    # Get all unique hand values and card counts
-    hand_values = set()
-    card_counts = set()
+    pushes_detail_matrix = results['pushes_detail_matrix']
     
-    for (value, count) in results['pushes_detail_matrix'].keys():
-        hand_values.add(value)
-        card_counts.add(count)
+    # Collect the unique hand values and card counts in one pass (dicts keep them de-duplicated)
+    hand_values = {}
+    card_counts = {}
+    for (value, count) in pushes_detail_matrix:
+        hand_values[value] = None
+        card_counts[count] = None
         
-    # Sort the values and counts for better readability
-    # Convert to list and sort
-    hand_values = sorted([v for v in hand_values if isinstance(v, int)] + 
-                        [v for v in hand_values if not isinstance(v, int)],
-                        key=lambda x: float('inf') if not isinstance(x, int) else x)
-    
-    # Sort card counts with integers first (in numeric order) followed by non-integers
-    int_counts = sorted([c for c in card_counts if isinstance(c, int)])
-    non_int_counts = sorted([c for c in card_counts if not isinstance(c, int)])
-    card_counts = int_counts + non_int_counts
-    
-    # Create a 2D matrix representation
-    matrix = {}
-    for value in hand_values:
-        matrix[value] = {}
-        for count in card_counts:
-            matrix[value][count] = results['pushes_detail_matrix'].get((value, count), 0)
-
+    # Sort integers numerically, followed by the other labels (e.g. 'bust', '12+') alphabetically
+    hand_values = (sorted(v for v in hand_values if isinstance(v, int)) +
+                   sorted((v for v in hand_values if not isinstance(v, int)), key=str))
+    card_counts = (sorted(c for c in card_counts if isinstance(c, int)) +
+                   sorted((c for c in card_counts if not isinstance(c, int)), key=str))
+    
     with open(filepath, 'w', newline='') as csvfile:
         writer = csv.writer(csvfile)
 
         header = ['Hand Value\\Card Count'] + [str(count) for count in card_counts]
         writer.writerow(header)
         
-        for value in hand_values:
-            row = [str(value)]
-            for count in card_counts:
-                row.append(matrix[value][count])
-            writer.writerow(row)
+        # Build each row straight from the push counts and hand them to the csv writer in one call
+        writer.writerows(
+            [str(value)] + [pushes_detail_matrix.get((value, count), 0) for count in card_counts]
+            for value in hand_values
+        )
             
-    print(f"Detailed push matrix saved to {filepath}")
+    logger.info("Detailed push matrix saved to %s", filepath)
     return filepath
 
 if __name__ == '__main__':
@@ -1,9 +1,20 @@
+from itertools import product
+
 class Card:
     """
     Represents a playing card with a suit and rank.
     """
+    __slots__ = ('suit', 'rank', 'rank_code', 'value')
+    
     SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
     RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King", "Ace"]
+    # Blackjack value of each rank code (index into RANKS); Ace counts as 11 here
+    VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
+    ACE = 12
+    RANK_CODES = {rank: code for code, rank in enumerate(RANKS)}
+    SUIT_SET = frozenset(SUITS)
+    # Display string for every (rank, suit), formatted once at import
+    _STR_TABLE = {(rank, suit): f"{rank} of {suit}" for rank, suit in product(RANKS, SUITS)}
     
     def __init__(self, suit, rank):
         """
@@ -13,13 +24,17 @@ class Card:
             suit (str): The card suit (Hearts, Diamonds, Clubs, Spades)
             rank (str): The card rank (2-10, Jack, Queen, King, Ace)
         """
-        if suit not in self.SUITS:
+        if suit not in self.SUIT_SET:
             raise ValueError(f"Invalid suit: {suit}")
-        if rank not in self.RANKS:
+        rank_code = self.RANK_CODES.get(rank)
+        if rank_code is None:
             raise ValueError(f"Invalid rank: {rank}")
             
         self.suit = suit
         self.rank = rank
+        self.rank_code = rank_code
+        # Ranks never change, so the blackjack value is fixed at construction
+        self.value = self.VALUES[self.rank_code]
         
     def get_value(self):
         """
@@ -28,17 +43,18 @@ class Card:
         Returns:
             int: Card value (1-11 for Ace, 10 for face cards, numerical value otherwise)
         """
-        if self.rank == "Ace":
-            return 11  # Ace's value will be adjusted as needed in the Hand class
-        elif self.rank in ["Jack", "Queen", "King"]:
-            return 10
-        else:
-            return int(self.rank)
+        # Ace's value will be adjusted as needed in the Hand class
+        return self.value
             
     def __str__(self):
         """String representation of the card."""
-        return f"{self.rank} of {self.suit}"
+        return self._STR_TABLE[self.rank, self.suit]
     
     def __repr__(self):
         """Formal string representation of the card."""
-        return f"Card('{self.suit}', '{self.rank}')"
\ No newline at end of file
+        return f"Card('{self.suit}', '{self.rank}')"
+
+
+# The 52 distinct cards in standard deck order. Cards are never mutated, so decks
+# and shoes share these instances instead of constructing new ones on every build.
+FULL_DECK = tuple(Card(suit, rank) for suit in Card.SUITS for rank in Card.RANKS)
\ No newline at end of file
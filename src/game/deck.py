@@ -1,5 +1,5 @@
 import random
-from src.game.card import Card
+from src.game.card import FULL_DECK
 
 class Deck:
     """
@@ -9,15 +9,20 @@ class Deck:
     def __init__(self):
         """Initialize a new deck of 52 cards in order."""
         self.cards = []
+        self._idx = 0  # Index of the next card to draw
         self._build()
         
     def _build(self):
         """Build a new deck of 52 cards."""
-        self.cards = [Card(suit, rank) for suit in Card.SUITS for rank in Card.RANKS]
+        self.cards = list(FULL_DECK)
+        self._idx = 0
         
     def shuffle(self):
-        """Shuffle the deck of cards."""
-        random.shuffle(self.cards)
+        """Shuffle the cards remaining in the deck."""
+        remaining = self.cards[self._idx:]
+        random.shuffle(remaining)
+        self.cards = remaining
+        self._idx = 0
         
     def draw(self):
         """
@@ -29,17 +34,20 @@ class Deck:
         Raises:
             IndexError: If the deck is empty
         """
-        if not self.cards:
+        if self._idx >= len(self.cards):
             raise IndexError("Cannot draw from an empty deck")
-        return self.cards.pop(0)
+        # Advance a cursor instead of pop(0), which shifts every remaining card
+        card = self.cards[self._idx]
+        self._idx += 1
+        return card
     
     def __len__(self):
         """Return the number of cards in the deck."""
-        return len(self.cards)
+        return len(self.cards) - self._idx
         
     def __str__(self):
         """String representation of the deck."""
-        return f"Deck with {len(self.cards)} cards"
+        return f"Deck with {len(self)} cards"
 
 
 class Shoe:
@@ -47,36 +55,41 @@ class Shoe:
     Represents a shoe of multiple decks used in casino games.
     """
     
-    def __init__(self, num_decks=6, reshuffle_cutoff=52):
+    def __init__(self, num_decks=6, reshuffle_cutoff=52, seed=None):
         """
         Initialize a shoe with multiple decks.
         
         Args:
             num_decks (int): Number of decks to use in the shoe
             reshuffle_cutoff (int): Minimum number of cards before reshuffling
+            seed (int, optional): Seed for a random generator owned by this shoe.
+                If None, the shared random module state is used.
         """
+        # A per-shoe generator gives independent, reproducible streams (e.g. one per worker)
+        self._rng = random if seed is None else random.Random(seed)
         self.num_decks = num_decks
         self.reshuffle_cutoff = reshuffle_cutoff
+        # Full shoe in deck order, copied into self.cards on every rebuild
+        self._full_shoe = FULL_DECK * num_decks
         self.cards = []
+        self._idx = 0  # Index of the next card to draw
         self.discard_pile = []
         self.continuous_shuffle = (reshuffle_cutoff == 0)
         self.build_and_shuffle()
         
     def build_and_shuffle(self):
         """Build and shuffle the shoe with the specified number of decks."""
-        self.cards = []
-        # Create multiple decks
-        for _ in range(self.num_decks):
-            deck = Deck()
-            self.cards.extend(deck.cards)
+        # Refill the existing list in place rather than allocating a new one
+        self.cards[:] = self._full_shoe
         
         # Return any cards from discard pile if we're reshuffling
         if self.discard_pile:
             self.cards.extend(self.discard_pile)
-            self.discard_pile = []
+            self.discard_pile.clear()
             
         # Shuffle all cards
-        random.shuffle(self.cards)
+        self._rng.shuffle(self.cards)
+        self._idx = 0
         
     def draw(self):
         """
@@ -85,33 +98,40 @@ class Shoe:
         Returns:
             Card: The card drawn from the top of the shoe
         """
-        if len(self.cards) <= self.reshuffle_cutoff and not self.continuous_shuffle:
+        cards = self.cards
+        idx = self._idx
+        # Remaining cards computed inline rather than through __len__
+        if len(cards) - idx <= self.reshuffle_cutoff and not self.continuous_shuffle:
             self.build_and_shuffle()
+            idx = 0
             
-        if not self.cards:
+        if idx >= len(cards):
             raise IndexError("Cannot draw from an empty shoe")
             
-        return self.cards.pop(0)
+        self._idx = idx + 1
+        return cards[idx]
         
     def return_to_discard(self, cards):
         """
         Return used cards to the discard pile.
         
+        With continuous shuffle the used cards are the ones already drawn, which are
+        still in the shoe behind the draw cursor, so the whole shoe is reshuffled in
+        place instead of copying card objects back in.
+        
         Args:
-            cards (list): List of Card objects to discard
+            cards (list): List of Card objects to discard (ignored with continuous shuffle)
         """
-        self.discard_pile.extend(cards)
-        
         if self.continuous_shuffle:
-            # For continuous shuffle, immediately return cards to the shoe and reshuffle
-            self.cards.extend(self.discard_pile)
-            self.discard_pile = []
-            random.shuffle(self.cards)
+            self._rng.shuffle(self.cards)
+            self._idx = 0
+        else:
+            self.discard_pile.extend(cards)
             
     def __len__(self):
         """Return the number of cards in the shoe."""
-        return len(self.cards)
+        return len(self.cards) - self._idx
         
     def __str__(self):
         """String representation of the shoe."""
-        return f"Shoe with {len(self.cards)} cards from {self.num_decks} decks"
\ No newline at end of file
+        return f"Shoe with {len(self)} cards from {self.num_decks} decks"
\ No newline at end of file
@@ -1,3 +1,7 @@
+from src.game.card import Card
+
+ACE = Card.ACE
+
 class Hand:
     """
     Represents a blackjack hand with cards and related operations.
@@ -7,6 +11,11 @@ class Hand:
         """Initialize an empty hand."""
         self.cards = []
         self.is_dealer_hand = False
+        # Running total and number of aces still counted as 11, kept up to date by add_card
+        self._total = 0
+        self._aces_as_11 = 0
+        # str() of the cards seen so far, extended lazily by card_strs()
+        self._card_strs = []
         
     def add_card(self, card):
         """
@@ -16,35 +25,67 @@ class Hand:
             card (Card): The card to add to the hand
         """
         self.cards.append(card)
+        self._total += card.value
+        if card.rank_code == ACE:
+            self._aces_as_11 += 1
+        
+        # Adjust for aces if necessary (convert from 11 to 1)
+        while self._total > 21 and self._aces_as_11 > 0:
+            self._total -= 10  # Reduce value by 10 (11 - 1)
+            self._aces_as_11 -= 1
         
     def clear(self):
-        """Clear all cards from the hand."""
-        self.cards = []
+        """Clear all cards from the hand, reusing the existing list."""
+        self.cards.clear()
+        self._total = 0
+        self._aces_as_11 = 0
+        # A fresh list, since copies of the old one may still be referenced
+        self._card_strs = []
+        
+    def card_strs(self):
+        """
+        Return the string form of each card in the hand.
+        
+        Strings are cached, so each card is formatted once however often the
+        hand is displayed; add_card itself does no extra work.
+        
+        Returns:
+            list: str(card) for every card, in hand order (a new list on each call)
+        """
+        strs = self._card_strs
+        if len(strs) < len(self.cards):
+            strs.extend(str(card) for card in self.cards[len(strs):])
+        return strs[:]
         
     def get_value(self):
         """
-        Calculate the total value of the hand, accounting for aces.
+        Return the total value of the hand, accounting for aces.
         
         Returns:
             int: The optimal value of the hand (highest possible without busting)
         """
-        total_value = 0
-        ace_count = 0
+        return self._total
         
-        # Sum up the value of all cards
-        for card in self.cards:
-            if card.rank == "Ace":
-                ace_count += 1
-                total_value += 11
-            else:
-                total_value += card.get_value()
+    def get_value_and_soft(self):
+        """
+        Return the hand value and softness together.
         
-        # Adjust for aces if necessary (convert from 11 to 1)
-        while total_value > 21 and ace_count > 0:
-            total_value -= 10  # Reduce value by 10 (11 - 1)
-            ace_count -= 1
-            
-        return total_value
+        Returns:
+            tuple: (value, is_soft) where value matches get_value() and is_soft
+            matches is_soft()
+        """
+        return self._total, self._aces_as_11 > 0
+        
+    def summary(self):
+        """
+        Return the hand's value and status flags together.
+        
+        Returns:
+            tuple: (value, is_soft, is_blackjack, is_bust) matching get_value(),
+            is_soft(), is_blackjack() and is_bust()
+        """
+        total = self._total
+        return total, self._aces_as_11 > 0, total == 21 and len(self.cards) == 2, total > 21
         
     def is_blackjack(self):
         """
@@ -53,7 +94,7 @@ class Hand:
         Returns:
             bool: True if the hand is a blackjack, False otherwise
         """
-        return len(self.cards) == 2 and self.get_value() == 21
+        return self._total == 21 and len(self.cards) == 2
         
     def is_bust(self):
         """
@@ -62,7 +103,7 @@ class Hand:
         Returns:
             bool: True if the hand busted, False otherwise
         """
-        return self.get_value() > 21
+        return self._total > 21
         
     def is_soft(self):
         """
@@ -71,21 +112,7 @@ class Hand:
         Returns:
             bool: True if the hand is soft, False otherwise
         """
-        # Check each card for an ace
-        has_ace = any(card.rank == "Ace" for card in self.cards)
-        if not has_ace:
-            return False
-            
-        # Calculate the value without one ace being 11
-        non_ace_value = sum(card.get_value() for card in self.cards 
-                          if card.rank != "Ace")
-        ace_count = sum(1 for card in self.cards if card.rank == "Ace")
-        
-        # Add aces as 1 each, except possibly one as 11
-        test_value = non_ace_value + ace_count
-        
-        # If we can add 10 more (making one ace=11) without busting, it's soft
-        return test_value + 10 <= 21
+        return self._aces_as_11 > 0
     
     def get_dealer_up_card(self):
         """
@@ -104,8 +131,8 @@ class Hand:
         if not self.cards:
             return "Empty hand"
             
-        card_list = ", ".join(str(card) for card in self.cards)
-        value = self.get_value()
-        soft = " (soft)" if self.is_soft() else ""
+        card_list = ", ".join(self.card_strs())
+        value, is_soft = self.get_value_and_soft()
+        soft = " (soft)" if is_soft else ""
         
         return f"Hand [{value}{soft}]: {card_list}"
\ No newline at end of file
@@ -90,6 +90,10 @@ def main():
                         help='Number of players at the table (default: 1)')
     parser.add_argument('--hit-rules', type=str, default="",
                         help='Custom hit rules (format: "hard:16,10:hit;soft:17:hit")')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes to split the hands across (default: 1)')
+    parser.add_argument('--seed', type=int,
+                        help='Random seed for the shoe (worker i uses seed + i)')
     
     # Reporting options
     parser.add_argument('--summary-file', type=str,
@@ -128,8 +132,8 @@ def main():
     print("\nStarting simulation...\n")
     
     # Run simulation
-    simulator = BlackjackSimulator(config)
-    results = simulator.run_simulation()
+    simulator = BlackjackSimulator(config, seed=args.seed)
+    results = simulator.run_simulation_parallel(args.workers)
     
     # Print summary to console
     print("\n" + simulator.get_results_summary())
@@ -137,10 +141,8 @@ def main():
     # Generate reports
     report_gen = ReportGenerator(simulator)
     
-    summary_path = report_gen.generate_summary_report(args.summary_file)
-    matrix_path = report_gen.generate_outcome_matrix_csv(args.matrix_file)
-    detailed_path = report_gen.generate_detailed_report(args.detailed_file)
-    config_path = report_gen.save_config(args.config_file)
+    summary_path, matrix_path, detailed_path, config_path = report_gen.generate_all_reports(
+        args.summary_file, args.matrix_file, args.detailed_file, args.config_file)
     
     print(f"\nSimulation complete. Reports generated in the 'results' directory.")
 
@@ -0,0 +1,22 @@
+import json
+
+# Config files are written with 2-space indentation whichever encoder is available,
+# since that is the only indent orjson supports
+try:
+    import orjson
+    
+    def load_json(f):
+        """Parse JSON from a binary file object with orjson"""
+        return orjson.loads(f.read())
+    
+    def dump_json(obj, f):
+        """Write obj as indented JSON to a binary file object with orjson"""
+        # Sidebet payouts mix int and str keys, which orjson only accepts with OPT_NON_STR_KEYS
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+except ImportError:
+    # orjson is optional; json.load accepts binary files as well
+    load_json = json.load
+    
+    def dump_json(obj, f):
+        """Write obj as indented JSON to a binary file object"""
+        f.write(json.dumps(obj, indent=2).encode())
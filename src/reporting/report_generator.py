@@ -1,22 +1,65 @@
 import os
-import csv
-import json
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+from src.reporting.json_io import dump_json
+
+# CSV label for each simulator result; anything else is reported as a push
+RESULT_LABELS = {"player_win": "Win", "dealer_win": "Loss"}
+
+# Most buffers a single writev call accepts on Linux
+_IOV_MAX = 1024
+
+def _write_all(fd, data):
+    """Write all of data to fd, retrying after short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _write_lines(filepath, lines):
+    """
+    Write pre-terminated text lines to filepath, handing the kernel up to _IOV_MAX
+    lines per writev call where the platform supports it.
+    """
+    buffers = [line.encode() for line in lines]
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        if not hasattr(os, 'writev'):
+            _write_all(fd, b''.join(buffers))
+            return
+        for start in range(0, len(buffers), _IOV_MAX):
+            batch = buffers[start:start + _IOV_MAX]
+            written = os.writev(fd, batch)
+            if written < sum(map(len, batch)):
+                _write_all(fd, b''.join(batch)[written:])
+    finally:
+        os.close(fd)
 
 class ReportGenerator:
     """
     Handles generation of reports from simulation results.
     """
     
-    def __init__(self, simulator):
+    def __init__(self, simulator, verbose=True):
         """
         Initialize the report generator.
         
         Args:
             simulator (BlackjackSimulator): The simulator containing results to report
+            verbose (bool): Print a "saved to" line for every file written
         """
         self.simulator = simulator
+        self.verbose = verbose
         self.results_dir = os.path.join(os.getcwd(), 'results')
+        os.makedirs(self.results_dir, exist_ok=True)
+        self._config_dir = None
+        # Shared by every default filename, so one run's reports carry the same timestamp
+        self.refresh_timestamp()
+        
+    def refresh_timestamp(self):
+        """Reset the timestamp used in default filenames, e.g. before reporting a new run."""
+        self._timestamp = time.strftime("%Y%m%d_%H%M%S")
         
     def generate_summary_report(self, filename=None):
         """
@@ -28,25 +71,8 @@ class ReportGenerator:
         Returns:
             str: Path to the generated report file
         """
-        if not self.simulator.results:
-            raise ValueError("No simulation results available to report")
-            
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
-            
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"blackjack_sim_summary_{timestamp}.txt"
-            
-        filepath = os.path.join(self.results_dir, filename)
-        
-        summary = self.simulator.get_results_summary()
-        
-        with open(filepath, 'w') as f:
-            f.write(summary)
-            
-        print(f"Summary report saved to {filepath}")
-        return filepath
+        self._check_results()
+        return self._report_saved("Summary report", self._write_summary(filename))
         
     def generate_outcome_matrix_csv(self, filename=None):
         """
@@ -58,46 +84,8 @@ class ReportGenerator:
         Returns:
             str: Path to the generated CSV file
         """
-        if not self.simulator.results:
-            raise ValueError("No simulation results available to report")
-
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
-
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"blackjack_sim_matrix_{timestamp}.csv"
-            
-        filepath = os.path.join(self.results_dir, filename)
-
-        outcome_matrix = self.simulator.results['outcome_matrix']
-
-        max_player = 21
-        max_dealer = 21
-        for player_total, dealer_total in outcome_matrix.keys():
-            max_player = max(max_player, player_total)
-            max_dealer = max(max_dealer, dealer_total)
-            
-        matrix = []
-        for _ in range(max_player + 1):
-            matrix.append([0] * (max_dealer + 1))
-            
-        for (player_total, dealer_total), count in outcome_matrix.items():
-            if player_total <= max_player and dealer_total <= max_dealer:
-                matrix[player_total][dealer_total] = count
-                
-        with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-
-            header = ['Player\\Dealer'] + list(range(max_dealer + 1))
-            writer.writerow(header)
-            
-            for player_total in range(max_player + 1):
-                row = [player_total] + matrix[player_total]
-                writer.writerow(row)
-                
-        print(f"Outcome matrix saved to {filepath}")
-        return filepath
+        self._check_results()
+        return self._report_saved("Outcome matrix", self._write_outcome_matrix(filename))
     
     def generate_detailed_report(self, filename=None):
         """
@@ -109,44 +97,119 @@ class ReportGenerator:
         Returns:
             str: Path to the generated CSV file
         """
+        self._check_results()
+        return self._report_saved("Detailed report", self._write_detailed(filename))
+    
+    def generate_all_reports(self, summary_file=None, matrix_file=None, detailed_file=None, config_file=None):
+        """
+        Generate the summary, outcome matrix and detailed reports and save the configuration.
+        
+        The results are validated once for all four files, and default filenames
+        share the generator's timestamp. The files are independent, so they are
+        written concurrently to overlap their disk I/O; the "saved to" lines are
+        printed afterwards from the calling thread, in a fixed order.
+        
+        Args:
+            summary_file (str, optional): Summary report filename
+            matrix_file (str, optional): Outcome matrix CSV filename
+            detailed_file (str, optional): Detailed CSV filename
+            config_file (str, optional): Configuration JSON filename
+            
+        Returns:
+            tuple: Paths of the summary, matrix, detailed and config files
+        """
+        self._check_results()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._write_summary, summary_file),
+                executor.submit(self._write_outcome_matrix, matrix_file),
+                executor.submit(self._write_detailed, detailed_file),
+                executor.submit(self._write_config, config_file),
+            ]
+            paths = tuple(f.result() for f in futures)
+            
+        for label, filepath in zip(("Summary report", "Outcome matrix", "Detailed report", "Configuration"), paths):
+            self._report_saved(label, filepath)
+        return paths
+    
+    def _check_results(self):
+        """Raise ValueError if the simulator has no results to report."""
         if not self.simulator.results:
             raise ValueError("No simulation results available to report")
             
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
-            
+    def _report_saved(self, label, filepath):
+        """Announce a written file (when verbose) and return its path."""
+        if self.verbose:
+            print(f"{label} saved to {filepath}")
+        return filepath
+        
+    def _write_summary(self, filename):
+        """Write the text summary report and return its path."""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"blackjack_sim_detailed_{timestamp}.csv"
+            filename = f"blackjack_sim_summary_{self._timestamp}.txt"
             
         filepath = os.path.join(self.results_dir, filename)
         
-        outcome_details = self.simulator.results['outcome_details']
+        summary = self.simulator.get_results_summary()
+        
+        with open(filepath, 'w') as f:
+            f.write(summary)
+            
+        return filepath
         
-        detailed_data = []
-        for (player_total, dealer_total, result), count in outcome_details.items():
-            win_loss = "Win" if result == "player_win" else ("Loss" if result == "dealer_win" else "Push")
+    def _write_outcome_matrix(self, filename):
+        """Write the outcome matrix CSV and return its path."""
+        if not filename:
+            filename = f"blackjack_sim_matrix_{self._timestamp}.csv"
             
-            entry = {
-                'player_total': player_total,
-                'dealer_total': dealer_total,
-                'result': win_loss,
-                'count': count,
-                'percentage': (count / self.simulator.results['total_bets']) * 100
-            }
-            detailed_data.append(entry)
+        filepath = os.path.join(self.results_dir, filename)
+
+        outcome_matrix = self.simulator.results['outcome_matrix']
+
+        # Transpose the keys once so both bounds are plain C-level max() calls over tuples
+        player_totals, dealer_totals = zip(*outcome_matrix) if outcome_matrix else ((), ())
+        max_player = max(21, max(player_totals, default=0))
+        max_dealer = max(21, max(dealer_totals, default=0))
+        
+        # Rows are read straight from the outcome counts instead of filling an intermediate matrix.
+        # Every field is an int (or the fixed header label), so nothing needs quoting and the rows
+        # are joined directly, with the same \r\n terminator csv.writer would use.
+        dealer_range = range(max_dealer + 1)
+        get_count = outcome_matrix.get
+        lines = [','.join(['Player\\Dealer', *map(str, dealer_range)]) + '\r\n']
+        lines.extend(
+            ','.join([str(player_total), *(str(get_count((player_total, dealer_total), 0)) for dealer_total in dealer_range)]) + '\r\n'
+            for player_total in range(max_player + 1)
+        )
+        
+        _write_lines(filepath, lines)
+                
+        return filepath
+    
+    def _write_detailed(self, filename):
+        """Write the detailed outcome CSV and return its path."""
+        if not filename:
+            filename = f"blackjack_sim_detailed_{self._timestamp}.csv"
             
-        detailed_data.sort(key=lambda x: (x['player_total'], x['dealer_total'], x['result']))
+        filepath = os.path.join(self.results_dir, filename)
+        
+        outcome_details = self.simulator.results['outcome_details']
         
-        with open(filepath, 'w', newline='') as csvfile:
-            fieldnames = ['player_total', 'dealer_total', 'result', 'count', 'percentage']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        total_bets = self.simulator.results['total_bets']
+        get_label = RESULT_LABELS.get
+        detailed_data = [(player_total, dealer_total, get_label(result, "Push"), count, (count / total_bets) * 100)
+                         for (player_total, dealer_total, result), count in outcome_details.items()]
             
-            writer.writeheader()
-            for entry in detailed_data:
-                writer.writerow(entry)
+        # Blackjack results share the "Push" label, so count must not break ties; those rows keep insertion order
+        detailed_data.sort(key=itemgetter(0, 1, 2))
+        
+        # No field ever needs quoting, so the lines are formatted directly (with csv's \r\n terminator)
+        lines = ['player_total,dealer_total,result,count,percentage\r\n']
+        lines.extend(f"{player_total},{dealer_total},{label},{count},{percentage}\r\n"
+                     for player_total, dealer_total, label, count, percentage in detailed_data)
+        
+        _write_lines(filepath, lines)
                 
-        print(f"Detailed report saved to {filepath}")
         return filepath
     
     def save_config(self, filename=None):
@@ -159,15 +222,20 @@ class ReportGenerator:
         Returns:
             str: Path to the generated JSON file
         """
+        return self._report_saved("Configuration", self._write_config(filename))
+        
+    def _write_config(self, filename):
+        """Write the configuration JSON and return its path."""
         config = self.simulator.config
         
-        config_dir = os.path.join(os.getcwd(), 'config')
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
+        # Created on first use only, since most callers never save a config
+        if self._config_dir is None:
+            self._config_dir = os.path.join(os.getcwd(), 'config')
+            os.makedirs(self._config_dir, exist_ok=True)
+        config_dir = self._config_dir
 
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"simulation_config_{timestamp}.json"
+            filename = f"simulation_config_{self._timestamp}.json"
             
         filepath = os.path.join(config_dir, filename)
         
@@ -180,11 +248,12 @@ class ReportGenerator:
             'commission_pct': config.commission_pct,
             'blackjack_payout': config.blackjack_payout,
             'num_players': config.num_players,
-            'player_hit_rules': str(config.player_hit_rules)
+            # JSON keys must be strings, so tuple keys are written as "(total, dealer)"
+            # the way SimulationConfig.from_dict reads them back
+            'player_hit_rules': {str(key): value for key, value in config.player_hit_rules.items()}
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(config_dict, f, indent=4)
+        with open(filepath, 'wb') as f:
+            dump_json(config_dict, f)
             
-        print(f"Configuration saved to {filepath}")
         return filepath
\ No newline at end of file
@@ -3,6 +3,12 @@ class SimulationConfig:
     Configuration settings for the blackjack simulation.
     """
     
+    __slots__ = ('num_hands', 'num_decks', 'player_hit_soft_17', 'dealer_hit_soft_17',
+                 'reshuffle_cutoff', 'commission_pct', 'blackjack_payout', 'num_players',
+                 'player_hit_rules', 'commission_on_blackjack', 'hit_against_blackjack',
+                 'sidebet_payout_mode', 'sidebet_payouts', 'commission_multiplier',
+                 '_str_cache', '_dict_cache')
+    
     def __init__(self, 
                  num_hands=100000000,
                  num_decks=6,
@@ -40,6 +46,7 @@ class SimulationConfig:
         self.player_hit_soft_17 = player_hit_soft_17
         self.dealer_hit_soft_17 = dealer_hit_soft_17
         self.reshuffle_cutoff = reshuffle_cutoff
+        # Also sets commission_multiplier (see __setattr__), so the per-hand payout path reads a plain attribute
         self.commission_pct = commission_pct
         self.blackjack_payout = blackjack_payout
         self.num_players = num_players
@@ -65,6 +72,15 @@ class SimulationConfig:
         else:
             self.sidebet_payouts = sidebet_payouts
         
+    def __setattr__(self, name, value):
+        """Set an attribute, dropping the cached __str__/to_dict output when a setting changes."""
+        object.__setattr__(self, name, value)
+        if name == 'commission_pct':
+            object.__setattr__(self, 'commission_multiplier', 1.0 - (value / 100.0))
+        if name[0] != '_':
+            object.__setattr__(self, '_str_cache', None)
+            object.__setattr__(self, '_dict_cache', None)
+        
     def get_commission_multiplier(self):
         """
         Get the multiplier to apply to winnings after commission.
@@ -72,16 +88,19 @@ class SimulationConfig:
         Returns:
             float: The commission multiplier
         """
-        return 1.0 - (self.commission_pct / 100.0)
+        return self.commission_multiplier
         
     def __str__(self):
         """String representation of the configuration."""
+        if self._str_cache is not None:
+            return self._str_cache
+            
         hit_rules_str = "Custom" if self.player_hit_rules else "Default"
         shuffle_type = "Continuous shuffle" if self.reshuffle_cutoff == 0 else f"Reshuffle at {self.reshuffle_cutoff} cards"
         
         sidebet_mode = "Hand Total" if self.sidebet_payout_mode == "total" else "Card Count"
         
-        return (f"Simulation Config:\n"
+        self._str_cache = (f"Simulation Config:\n"
                 f"  Hands: {self.num_hands}\n"
                 f"  Decks: {self.num_decks}\n"
                 f"  Player hit soft 17: {self.player_hit_soft_17}\n"
@@ -95,6 +114,7 @@ class SimulationConfig:
                 f"  Hit against dealer blackjack: {self.hit_against_blackjack}\n"
                 f"  Sidebet payout mode: {sidebet_mode}\n"
                 f"  Sidebet payouts: {self.sidebet_payouts}")
+        return self._str_cache
                 
     def to_dict(self):
         """
@@ -103,6 +123,10 @@ class SimulationConfig:
         Returns:
             dict: Dictionary representation of configuration
         """
+        # The cached dict is copied so callers can add keys without affecting later calls
+        if self._dict_cache is not None:
+            return dict(self._dict_cache)
+            
         serializable_hit_rules = {}
         for key, value in self.player_hit_rules.items():
             if isinstance(key, tuple):
@@ -110,7 +134,7 @@ class SimulationConfig:
             else:
                 serializable_hit_rules[key] = value
                 
-        return {
+        self._dict_cache = {
             'num_hands': self.num_hands,
             'num_decks': self.num_decks,
             'player_hit_soft_17': self.player_hit_soft_17,
@@ -126,6 +150,7 @@ class SimulationConfig:
             'sidebet_payouts': self.sidebet_payouts,
             'shuffle_type': "Continuous shuffle" if self.reshuffle_cutoff == 0 else f"Reshuffle at {self.reshuffle_cutoff} cards"
         }
+        return dict(self._dict_cache)
         
     @classmethod
     def from_dict(cls, config_dict):
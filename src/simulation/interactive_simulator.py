@@ -127,11 +127,12 @@ class InteractiveSimulator(BlackjackSimulator):
         }
         
         self.update_statistics(result, player_value, dealer_value, player_hand, self.current_dealer_hand)
+        self.collect_outcome_counts()
         self.update_current_stats()
         
         self.hand_history.append({
-            "player_hand": [str(card) for card in player_hand.cards],
-            "dealer_hand": [str(card) for card in self.current_dealer_hand.cards],
+            "player_hand": player_hand.card_strs(),
+            "dealer_hand": self.current_dealer_hand.card_strs(),
             "result": result,
             "player_value": player_value,
             "dealer_value": dealer_value
@@ -163,24 +164,37 @@ class InteractiveSimulator(BlackjackSimulator):
     
     def get_current_state(self):
         """Get the current state of the interactive simulation."""
+        # One summary() per hand supplies the value and all status flags
+        player_states = []
+        for hand in self.current_player_hands:
+            value, is_soft, is_blackjack, is_bust = hand.summary()
+            player_states.append({
+                "cards": hand.card_strs(),
+                "value": value,
+                "is_soft": is_soft,
+                "is_blackjack": is_blackjack,
+                "is_bust": is_bust
+            })
+            
+        dealer_state = None
+        dealer_hand = self.current_dealer_hand
+        if dealer_hand:
+            value, is_soft, is_blackjack, is_bust = dealer_hand.summary()
+            dealer_cards = dealer_hand.card_strs()
+            dealer_state = {
+                "cards": dealer_cards,
+                "value": value,
+                "is_soft": is_soft,
+                "is_blackjack": is_blackjack,
+                "is_bust": is_bust,
+                "visible_card": dealer_cards[0] if dealer_hand.get_dealer_up_card() else None
+            }
+            
         return {
             "phase": self.current_phase,
             "step": self.step_count,
-            "player_hands": [{
-                "cards": [str(card) for card in hand.cards],
-                "value": hand.get_value(),
-                "is_soft": hand.is_soft(),
-                "is_blackjack": hand.is_blackjack(),
-                "is_bust": hand.is_bust()
-            } for hand in self.current_player_hands],
-            "dealer_hand": {
-                "cards": [str(card) for card in self.current_dealer_hand.cards],
-                "value": self.current_dealer_hand.get_value(),
-                "is_soft": self.current_dealer_hand.is_soft(),
-                "is_blackjack": self.current_dealer_hand.is_blackjack(),
-                "is_bust": self.current_dealer_hand.is_bust(),
-                "visible_card": str(self.current_dealer_hand.get_dealer_up_card()) if self.current_dealer_hand.get_dealer_up_card() else None
-            } if self.current_dealer_hand else None,
+            "player_hands": player_states,
+            "dealer_hand": dealer_state,
             "result": self.current_hand_result,
             "stats": self.current_stats,
             "history_length": len(self.hand_history)
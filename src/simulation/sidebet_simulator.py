@@ -2,19 +2,26 @@ from src.simulation.simulator import BlackjackSimulator
 from src.game.hand import Hand
 import time
 
+# Positions of the bust and blackjack pushes in the hand-total payout table
+BUST_PUSH = 22
+BLACKJACK_PUSH = 23
+
 class SidebetSimulator(BlackjackSimulator):
     """
     A simulator for the push sidebet which pays when the player and dealer push (tie).
     """
     
-    def __init__(self, config=None):
+    DERIVED_RESULTS = BlackjackSimulator.DERIVED_RESULTS + ('sidebet_edge',)
+    
+    def __init__(self, config=None, seed=None):
         """
         Initialize the sidebet simulator.
         
         Args:
             config (SimulationConfig, optional): Configuration settings
+            seed (int, optional): Seed for the shoe's own random generator
         """
-        super().__init__(config)
+        super().__init__(config, seed)
     
     def setup(self):
         """
@@ -34,6 +41,18 @@ class SidebetSimulator(BlackjackSimulator):
             'player_blackjacks': 0,
             'dealer_blackjacks': 0
         })
+        
+        # Resolve every possible push payout once, so a push indexes a tuple instead of
+        # hashing int and string keys in sidebet_payouts
+        payouts = self.config.sidebet_payouts
+        self._payout_by_total = self.config.sidebet_payout_mode == "total"
+        if self._payout_by_total:
+            # Indexed by push total 0-21, then BUST_PUSH and BLACKJACK_PUSH
+            self._push_payouts = tuple(payouts.get(value, 0) for value in range(22)) + (
+                payouts.get('bust-bust', 0), payouts.get('blackjack-blackjack', 0))
+        else:
+            # Indexed by total cards dealt, with everything from 12 up sharing the '12+' entry
+            self._push_payouts = tuple(payouts.get(cards, 0) for cards in range(12)) + (payouts.get('12+', 0),)
     
     def play_hand(self, player_hand, dealer_hand):
         """
@@ -57,56 +76,55 @@ class SidebetSimulator(BlackjackSimulator):
         if dealer_blackjack:
             self.results['dealer_blackjacks'] += 1
         
-        # If both have blackjack, it's a push
-        if player_blackjack and dealer_blackjack:
-            return "push", 21, 21
+        # Draw loops call these once per card, so bind them once per hand
+        draw = self.shoe.draw
+        player_should_hit = self.player_strategy.should_hit
+        
+        if player_blackjack or dealer_blackjack:
+            # If both have blackjack, it's a push
+            if player_blackjack and dealer_blackjack:
+                return "push", 21, 21
+            
+            # If player has blackjack and dealer doesn't, player wins
+            if player_blackjack:
+                return "player_win", 21, dealer_hand.get_value()
             
-        # If dealer has blackjack and player doesn't, dealer wins
-        if dealer_blackjack and not player_blackjack:
+            # Dealer has blackjack and player doesn't, so dealer wins.
             # Allow player to hit against a dealer blackjack if configured
             if self.config.hit_against_blackjack:
                 dealer_up_card = dealer_hand.get_dealer_up_card()
-                while self.player_strategy.should_hit(player_hand, dealer_up_card):
-                    player_hand.add_card(self.shoe.draw())
-                player_value = player_hand.get_value()
-                return "dealer_win", player_value, 21
-            else:
-                return "dealer_win", player_hand.get_value(), 21
-            
-        # If player has blackjack and dealer doesn't, player wins
-        if player_blackjack and not dealer_blackjack:
-            return "player_win", 21, dealer_hand.get_value()
+                while player_should_hit(player_hand, dealer_up_card):
+                    player_hand.add_card(draw())
+            return "dealer_win", player_hand.get_value(), 21
         
         # Get dealer's up card for strategy decisions
         dealer_up_card = dealer_hand.get_dealer_up_card()
         
         # Player draws cards
-        while self.player_strategy.should_hit(player_hand, dealer_up_card):
-            player_hand.add_card(self.shoe.draw())
+        while player_should_hit(player_hand, dealer_up_card):
+            player_hand.add_card(draw())
             
         player_value = player_hand.get_value()
-        player_busted = player_hand.is_bust()
+        player_busted = player_value > 21
         
         # Dealer draws cards
-        while self.dealer_strategy.should_hit(dealer_hand):
-            dealer_hand.add_card(self.shoe.draw())
+        dealer_should_hit = self.dealer_strategy.should_hit
+        while dealer_should_hit(dealer_hand):
+            dealer_hand.add_card(draw())
             
         dealer_value = dealer_hand.get_value()
-        dealer_busted = dealer_hand.is_bust()
-        
-        # Determine outcome
-        if player_busted and dealer_busted:
-            return "push", player_value, dealer_value
-        elif player_busted:
-            return "dealer_win", player_value, dealer_value
-        elif dealer_busted:
-            return "player_win", player_value, dealer_value
-        elif player_value > dealer_value:
-            return "player_win", player_value, dealer_value
+        dealer_busted = dealer_value > 21
+        
+        # Determine outcome: a double bust pushes, a single bust loses, otherwise the higher total wins
+        if player_busted:
+            result = "push" if dealer_busted else "dealer_win"
+        elif dealer_busted or player_value > dealer_value:
+            result = "player_win"
         elif dealer_value > player_value:
-            return "dealer_win", player_value, dealer_value
+            result = "dealer_win"
         else:
-            return "push", player_value, dealer_value
+            result = "push"
+        return result, player_value, dealer_value
     
     def update_statistics(self, result, player_value, dealer_value, player_hand, dealer_hand):
         """
@@ -123,71 +141,81 @@ class SidebetSimulator(BlackjackSimulator):
         
         # Track push-specific statistics for the sidebet
         if result == "push":
-            self.results['total_pushes'] += 1
+            results = self.results
+            results['total_pushes'] += 1
+            pushes_by_value = results['pushes_by_value']
+            player_blackjack = player_hand.is_blackjack()
+            dealer_blackjack = dealer_hand.is_blackjack()
             
             # Determine value type for categorization
             value_type = None
             if player_value > 21:  # Both busted
                 value_type = 'bust'
-                self.results['pushes_by_value']['bust'] += 1
-            elif player_hand.is_blackjack() and dealer_hand.is_blackjack():
+                pushes_by_value['bust'] += 1
+            elif player_blackjack and dealer_blackjack:
                 value_type = 'blackjack'
-                self.results['pushes_by_value']['blackjack'] += 1
+                pushes_by_value['blackjack'] += 1
             elif player_value == 21:
                 # Differentiate between blackjack and non-blackjack 21
-                if player_hand.is_blackjack() or dealer_hand.is_blackjack():
+                if player_blackjack or dealer_blackjack:
                     # This is a case where one side has blackjack and other has 21
                     value_type = '21_with_bj'
                 else:
                     value_type = 21
-                self.results['pushes_by_value'][21] += 1
-            elif player_value in self.results['pushes_by_value']:
+                pushes_by_value[21] += 1
+            elif player_value in pushes_by_value:
                 value_type = player_value
-                self.results['pushes_by_value'][player_value] += 1
+                pushes_by_value[player_value] += 1
                 
             # Track pushes by card count
             total_cards = len(player_hand.cards) + len(dealer_hand.cards)
             card_count_key = '12+' if total_cards >= 12 else total_cards
-            if total_cards >= 12:
-                self.results['pushes_by_card_count']['12+'] += 1
-            elif total_cards in self.results['pushes_by_card_count']:
-                self.results['pushes_by_card_count'][total_cards] += 1
+            pushes_by_card_count = results['pushes_by_card_count']
+            if card_count_key in pushes_by_card_count:
+                pushes_by_card_count[card_count_key] += 1
                 
             # Update the detailed matrix
+            pushes_detail_matrix = results['pushes_detail_matrix']
             matrix_key = (value_type, card_count_key)
-            if matrix_key not in self.results['pushes_detail_matrix']:
-                self.results['pushes_detail_matrix'][matrix_key] = 0
-            self.results['pushes_detail_matrix'][matrix_key] += 1
+            pushes_detail_matrix[matrix_key] = pushes_detail_matrix.get(matrix_key, 0) + 1
                 
             # Calculate sidebet payout based on configuration
-            payout_multiplier = 0
-            if self.config.sidebet_payout_mode == "total":
+            if self._payout_by_total:
                 # Payout based on total value
                 if player_value > 21:  # Both busted
-                    payout_multiplier = self.config.sidebet_payouts.get('bust-bust', 0)
-                elif player_hand.is_blackjack() and dealer_hand.is_blackjack():
-                    payout_multiplier = self.config.sidebet_payouts.get('blackjack-blackjack', 0)
+                    payout_multiplier = self._push_payouts[BUST_PUSH]
+                elif player_blackjack and dealer_blackjack:
+                    payout_multiplier = self._push_payouts[BLACKJACK_PUSH]
                 else:
-                    payout_multiplier = self.config.sidebet_payouts.get(player_value, 0)
+                    payout_multiplier = self._push_payouts[player_value]
             else:  # card count mode
                 # Payout based on total cards
-                if total_cards >= 12:
-                    payout_multiplier = self.config.sidebet_payouts.get('12+', 0)
-                else:
-                    payout_multiplier = self.config.sidebet_payouts.get(total_cards, 0)
+                payout_multiplier = self._push_payouts[min(total_cards, 12)]
             
             # Update sidebet stats
             self.results['sidebet_wins'] += 1
             self.results['sidebet_payouts'] += payout_multiplier
+    
+    @property
+    def sidebet_edge(self):
+        """
+        Sidebet house edge in percent over the hands played so far.
         
-        # Calculate sidebet edge after each hand
-        if self.results['total_bets'] > 0:
-            self.results['sidebet_edge'] = (self.results['sidebet_payouts'] - self.results['total_bets']) / self.results['total_bets'] * 100
+        Computed on read rather than after every hand; results['sidebet_edge'] is
+        refreshed from it when a run finishes or the interactive stats update.
+        """
+        total_bets = self.results['total_bets']
+        if total_bets > 0:
+            return (self.results['sidebet_payouts'] - total_bets) / total_bets * 100
+        return self.results['sidebet_edge']
     
-    def run_simulation(self):
+    def run_simulation(self, report_progress=True):
         """
         Run the simulation for the specified number of hands.
         
+        Args:
+            report_progress (bool): Print a progress line every million hands
+            
         Returns:
             dict: The simulation results
         """
@@ -195,39 +223,65 @@ class SidebetSimulator(BlackjackSimulator):
         
         start_time = time.time()
         
+        # Progress is reported every million hands; comparing against the next
+        # milestone is cheaper than taking a modulo on every hand
+        progress_every = 1000000
+        next_report = progress_every if report_progress else float('inf')
+        
+        # Loop invariants, bound once instead of looked up on every hand
+        results = self.results
+        shoe = self.shoe
+        reshuffle_cutoff = self.config.reshuffle_cutoff
+        deal_initial_cards = self.deal_initial_cards
+        play_hand = self.play_hand
+        update_statistics = self.update_statistics
+        
+        # One player and one dealer hand, cleared and reused for every round
+        player_hand = Hand()
+        player_hands = [player_hand]
+        dealer_hand = Hand()
+        dealer_hand.is_dealer_hand = True
+        
         for _ in range(self.config.num_hands):
             # Reshuffle if needed
-            if self.config.reshuffle_cutoff > 0 and len(self.shoe) < self.config.reshuffle_cutoff:
-                self.shoe.build_and_shuffle()
+            if reshuffle_cutoff > 0 and len(shoe) < reshuffle_cutoff:
+                shoe.build_and_shuffle()
                 
-            # Create player and dealer hands
-            player_hand = Hand()
-            dealer_hand = Hand()
-            dealer_hand.is_dealer_hand = True
+            player_hand.clear()
+            dealer_hand.clear()
             
             # Deal initial cards
-            self.deal_initial_cards([player_hand], dealer_hand)
+            deal_initial_cards(player_hands, dealer_hand)
             
             # Play the hand
-            result, player_value, dealer_value = self.play_hand(player_hand, dealer_hand)
+            result, player_value, dealer_value = play_hand(player_hand, dealer_hand)
             
             # Update statistics
-            self.update_statistics(result, player_value, dealer_value, player_hand, dealer_hand)
+            update_statistics(result, player_value, dealer_value, player_hand, dealer_hand)
             
-            if self.results['total_bets'] % 1000000 == 0:
-                print(f"Simulated {self.results['total_bets']} hands...")
+            if results['total_bets'] >= next_report:
+                print(f"Simulated {results['total_bets']} hands...")
+                next_report += progress_every
                 
         end_time = time.time()
         simulation_time = end_time - start_time
         
+        self.collect_outcome_counts()
+        
         # Add simulation time to results
         self.results['simulation_time'] = simulation_time
         
+        self._calculate_edges()
+            
+        return self.results
+        
+    def _calculate_edges(self):
+        """Set results['sidebet_edge'] and the main bet's results['house_edge'] from the counters."""
+        self.results['sidebet_edge'] = self.sidebet_edge
+        
         # Calculate house edge for main bet
         if self.results['total_bets'] > 0:
             self.results['house_edge'] = -self.results['net_win_amount'] / self.results['total_bets'] * 100
-            
-        return self.results
 
 
 class InteractiveSidebetSimulator(SidebetSimulator):
@@ -244,6 +298,8 @@ class InteractiveSidebetSimulator(SidebetSimulator):
         self.hand_history = []
         self.current_hand_result = None
         self.step_count = 0
+        # Dealer decision already evaluated for the dealer hand as it stands, if any
+        self._dealer_will_hit = None
         self.current_stats = {
             'total_hands': 0,
             'player_wins': 0,
@@ -274,6 +330,7 @@ class InteractiveSidebetSimulator(SidebetSimulator):
         self.current_dealer_hand.is_dealer_hand = True
         self.current_hand_result = None
         self.step_count = 0
+        self._dealer_will_hit = None
         
         # If initial cards are provided, set them up
         if player_initial_cards and dealer_initial_cards:
@@ -350,7 +407,13 @@ class InteractiveSidebetSimulator(SidebetSimulator):
         if self.current_phase != "dealer_turn":
             return {"error": "Not in dealer turn phase."}
             
-        if self.dealer_strategy.should_hit(self.current_dealer_hand):
+        # Reuse the decision made at the end of the previous step for the same hand
+        should_hit = self._dealer_will_hit
+        if should_hit is None:
+            should_hit = self.dealer_strategy.should_hit(self.current_dealer_hand)
+        self._dealer_will_hit = None
+            
+        if should_hit:
             self.current_dealer_hand.add_card(self.shoe.draw())
             self.step_count += 1
             
@@ -358,6 +421,7 @@ class InteractiveSidebetSimulator(SidebetSimulator):
             if not self.dealer_strategy.should_hit(self.current_dealer_hand):
                 return self.complete_hand()
                 
+            self._dealer_will_hit = True
             return self.get_current_state()
         else:
             # Dealer is done
@@ -387,6 +451,7 @@ class InteractiveSidebetSimulator(SidebetSimulator):
         
         # Add sidebet-specific stats
         if self.results['total_bets'] > 0:
+            self.results['sidebet_edge'] = self.sidebet_edge
             self.current_stats['sidebet_stats'] = {
                 'total_pushes': self.results['total_pushes'],
                 'by_value': self.results['pushes_by_value'],
@@ -396,24 +461,37 @@ class InteractiveSidebetSimulator(SidebetSimulator):
     
     def get_current_state(self):
         """Get the current state of the interactive simulation."""
+        # One summary() per hand supplies the value and all status flags
+        player_states = []
+        for hand in self.current_player_hands:
+            value, is_soft, is_blackjack, is_bust = hand.summary()
+            player_states.append({
+                "cards": hand.card_strs(),
+                "value": value,
+                "is_soft": is_soft,
+                "is_blackjack": is_blackjack,
+                "is_bust": is_bust
+            })
+            
+        dealer_state = None
+        dealer_hand = self.current_dealer_hand
+        if dealer_hand:
+            value, is_soft, is_blackjack, is_bust = dealer_hand.summary()
+            dealer_cards = dealer_hand.card_strs()
+            dealer_state = {
+                "cards": dealer_cards,
+                "value": value,
+                "is_soft": is_soft,
+                "is_blackjack": is_blackjack,
+                "is_bust": is_bust,
+                "visible_card": dealer_cards[0] if dealer_hand.get_dealer_up_card() else None
+            }
+            
         state = {
             "phase": self.current_phase,
             "step": self.step_count,
-            "player_hands": [{
-                "cards": [str(card) for card in hand.cards],
-                "value": hand.get_value(),
-                "is_soft": hand.is_soft(),
-                "is_blackjack": hand.is_blackjack(),
-                "is_bust": hand.is_bust()
-            } for hand in self.current_player_hands],
-            "dealer_hand": {
-                "cards": [str(card) for card in self.current_dealer_hand.cards],
-                "value": self.current_dealer_hand.get_value(),
-                "is_soft": self.current_dealer_hand.is_soft(),
-                "is_blackjack": self.current_dealer_hand.is_blackjack(),
-                "is_bust": self.current_dealer_hand.is_bust(),
-                "visible_card": str(self.current_dealer_hand.get_dealer_up_card()) if self.current_dealer_hand.get_dealer_up_card() else None
-            } if self.current_dealer_hand else None,
+            "player_hands": player_states,
+            "dealer_hand": dealer_state,
             "result": self.current_hand_result,
             "stats": self.current_stats,
             "history_length": len(self.hand_history)
@@ -421,16 +499,15 @@ class InteractiveSidebetSimulator(SidebetSimulator):
         
         # Add sidebet-specific state information
         if self.current_phase == "result" and self.current_hand_result and self.current_hand_result["result"] == "push":
-            player_hand = self.current_player_hands[0]
-            dealer_hand = self.current_dealer_hand
-            total_cards = len(player_hand.cards) + len(dealer_hand.cards)
+            player_state = player_states[0]
+            total_cards = len(player_state["cards"]) + len(dealer_state["cards"])
             
             state["sidebet_result"] = {
                 "is_push": True,
                 "value": self.current_hand_result["player_value"],
                 "total_cards": total_cards,
-                "is_blackjack_push": player_hand.is_blackjack() and dealer_hand.is_blackjack(),
-                "is_bust_push": player_hand.is_bust() and dealer_hand.is_bust()
+                "is_blackjack_push": player_state["is_blackjack"] and dealer_state["is_blackjack"],
+                "is_bust_push": player_state["is_bust"] and dealer_state["is_bust"]
             }
         else:
             state["sidebet_result"] = {"is_push": False}
@@ -456,11 +533,12 @@ class InteractiveSidebetSimulator(SidebetSimulator):
         }
         
         self.update_statistics(result, player_value, dealer_value, player_hand, self.current_dealer_hand)
+        self.collect_outcome_counts()
         self.update_current_stats()
         
         self.hand_history.append({
-            "player_hand": [str(card) for card in player_hand.cards],
-            "dealer_hand": [str(card) for card in self.current_dealer_hand.cards],
+            "player_hand": player_hand.card_strs(),
+            "dealer_hand": self.current_dealer_hand.card_strs(),
             "result": result,
             "player_value": player_value,
             "dealer_value": dealer_value,
@@ -3,21 +3,50 @@ from src.game.hand import Hand
 from src.strategy.dealer_strategy import DealerStrategy
 from src.strategy.player_strategy import PlayerStrategy
 from src.simulation.config import SimulationConfig
+import copy
+import multiprocessing
+import os
+import random
 import time
 
+# Totals above this are grouped together in the outcome matrix
+MATRIX_CAP = 30
+MATRIX_SIZE = MATRIX_CAP + 1
+
+# Every hand result, in the order used to index the detailed outcome counters
+RESULT_CODES = ("dealer_win", "player_win", "push", "dealer_blackjack", "player_blackjack")
+_RESULT_INDEX = {result: index for index, result in enumerate(RESULT_CODES)}
+# Counter each result adds to; we bet on the dealer, so a dealer win is our win
+_RESULT_COUNTERS = ("player_wins", "dealer_wins", "pushes", "player_wins", "dealer_wins")
+
+
+def _run_chunk(simulator_cls, config, num_hands, seed):
+    """Run num_hands of a simulator_cls simulation in a worker process and return its raw results."""
+    chunk_config = copy.copy(config)
+    chunk_config.num_hands = num_hands
+    # The parent reports once for the whole run, so workers stay quiet
+    return simulator_cls(chunk_config, seed=seed).run_simulation(report_progress=False)
+
+
 class BlackjackSimulator:
     """
     Main blackjack simulation engine.
     """
     
-    def __init__(self, config=None):
+    # Results computed from the counters rather than counted, so never summed across chunks
+    DERIVED_RESULTS = ('house_edge', 'simulation_time')
+    
+    def __init__(self, config=None, seed=None):
         """
         Initialize the blackjack simulator.
         
         Args:
             config (SimulationConfig, optional): Configuration settings
+            seed (int, optional): Seed for the shoe's own random generator.
+                If None, the shoe uses the shared random module state.
         """
         self.config = config or SimulationConfig()
+        self.seed = seed
         self.shoe = None
         self.dealer_strategy = None
         self.player_strategy = None
@@ -30,7 +59,8 @@ class BlackjackSimulator:
         # shoe
         self.shoe = Shoe(
             num_decks=self.config.num_decks,
-            reshuffle_cutoff=self.config.reshuffle_cutoff
+            reshuffle_cutoff=self.config.reshuffle_cutoff,
+            seed=self.seed
         )
         
         #strategies
@@ -58,6 +88,16 @@ class BlackjackSimulator:
             'outcome_details': {},  # {(player_total, dealer_total, result): count}
         }
         
+        # Net win per result in RESULT_CODES order: regular wins pay 1:1 less commission,
+        # blackjack wins pay the blackjack payout with no commission, losses lose the bet
+        self._net_deltas = (self.config.commission_multiplier, -1, 0, self.config.blackjack_payout, -1)
+        
+        # Dense counters behind outcome_matrix and outcome_details, indexed by
+        # player_key * MATRIX_SIZE + dealer_key (times len(RESULT_CODES) plus the
+        # result's index for the details); collect_outcome_counts() fills the dicts
+        self._matrix_counts = [0] * (MATRIX_SIZE * MATRIX_SIZE)
+        self._detail_counts = [0] * (MATRIX_SIZE * MATRIX_SIZE * len(RESULT_CODES))
+        
     def deal_initial_cards(self, player_hands, dealer_hand):
         """
         Deal the initial two cards to each hand.
@@ -97,50 +137,52 @@ class BlackjackSimulator:
         player_blackjack = player_hand.is_blackjack()
         dealer_blackjack = dealer_hand.is_blackjack()
         
-        # If both have blackjack, it's a push
-        if player_blackjack and dealer_blackjack:
-            return "push", 21, 21
-            
-        # If dealer has blackjack, we win with 3:2 payout (no commission)
-        if dealer_blackjack and not player_blackjack:
-            return "dealer_blackjack", player_hand.get_value(), 21
-            
-        # If player has blackjack, we lose
-        if player_blackjack and not dealer_blackjack:
+        if player_blackjack or dealer_blackjack:
+            # If both have blackjack, it's a push
+            if player_blackjack and dealer_blackjack:
+                return "push", 21, 21
+                
+            # If dealer has blackjack, we win with 3:2 payout (no commission)
+            if dealer_blackjack:
+                return "dealer_blackjack", player_hand.get_value(), 21
+                
+            # If player has blackjack, we lose
             return "player_blackjack", 21, dealer_hand.get_value()
         
+        # Draw loops call these once per card, so bind them once per hand
+        draw = self.shoe.draw
+        player_should_hit = self.player_strategy.should_hit
+        dealer_should_hit = self.dealer_strategy.should_hit
+        
         # Get dealer's up card for strategy decisions
         dealer_up_card = dealer_hand.get_dealer_up_card()
         
         # Player draws cards
-        while self.player_strategy.should_hit(player_hand, dealer_up_card):
-            player_hand.add_card(self.shoe.draw())
+        while player_should_hit(player_hand, dealer_up_card):
+            player_hand.add_card(draw())
             
         player_value = player_hand.get_value()
-        player_busted = player_hand.is_bust()
+        player_busted = player_value > 21
         
         # Dealer draws cards
-        while self.dealer_strategy.should_hit(dealer_hand):
-            dealer_hand.add_card(self.shoe.draw())
+        while dealer_should_hit(dealer_hand):
+            dealer_hand.add_card(draw())
             
         dealer_value = dealer_hand.get_value()
-        dealer_busted = dealer_hand.is_bust()
+        dealer_busted = dealer_value > 21
         
         # In this variant, betting on dealer:
         # If dealer wins the hand, we win (since we bet on dealer)
         # If player wins the hand, we lose (since we bet on dealer)
-        if player_busted and dealer_busted:
-            return "push", player_value, dealer_value
-        elif player_busted:
-            return "dealer_win", player_value, dealer_value  # Regular win
-        elif dealer_busted:
-            return "player_win", player_value, dealer_value  # Loss
-        elif player_value > dealer_value:
-            return "player_win", player_value, dealer_value  # Loss
+        if player_busted:
+            result = "push" if dealer_busted else "dealer_win"  # Regular win
+        elif dealer_busted or player_value > dealer_value:
+            result = "player_win"  # Loss
         elif dealer_value > player_value:
-            return "dealer_win", player_value, dealer_value  # Regular win
+            result = "dealer_win"  # Regular win
         else:
-            return "push", player_value, dealer_value
+            result = "push"
+        return result, player_value, dealer_value
     
     def update_statistics(self, result, player_value, dealer_value, player_hand, dealer_hand):
         """
@@ -153,102 +195,206 @@ class BlackjackSimulator:
             player_hand (Hand): The player's hand
             dealer_hand (Hand): The dealer's hand
         """
+        results = self.results
+        result_index = _RESULT_INDEX[result]
+        
         # Track win/loss/push counts and calculate payouts
-        if result == "dealer_win":
-            self.results['player_wins'] += 1  # We win when dealer wins
-            # Regular win - apply commission
-            win_amount = self.config.get_commission_multiplier()
-            self.results['net_win_amount'] += win_amount
-            
-        elif result == "dealer_blackjack":
-            self.results['player_wins'] += 1
-            self.results['blackjacks'] += 1
-            # Blackjack win - 3:2 payout with no commission
-            win_amount = self.config.blackjack_payout
-            self.results['net_win_amount'] += win_amount
-            
-        elif result in ["player_win", "player_blackjack"]:
-            self.results['dealer_wins'] += 1  # We lose when player wins
-            # Lose entire bet
-            self.results['net_win_amount'] -= 1
-            
-        else:  # push
-            self.results['pushes'] += 1
+        results[_RESULT_COUNTERS[result_index]] += 1
+        if result == "dealer_blackjack":
+            results['blackjacks'] += 1
+        results['net_win_amount'] += self._net_deltas[result_index]
             
         # Update bust statistics
         if player_value > 21:
-            self.results['player_busts'] += 1
+            results['player_busts'] += 1
         if dealer_value > 21:
-            self.results['dealer_busts'] += 1
+            results['dealer_busts'] += 1
             
-        # Track outcome frequencies
-        player_key = min(player_value, 30)  # Cap at 30 for matrix
-        dealer_key = min(dealer_value, 30)
-        
-        # Update outcome matrix
-        outcome_key = (player_key, dealer_key)
-        if outcome_key not in self.results['outcome_matrix']:
-            self.results['outcome_matrix'][outcome_key] = 0
-        self.results['outcome_matrix'][outcome_key] += 1
-        
-        # Update detailed outcomes
-        detail_key = (player_key, dealer_key, result)
-        if detail_key not in self.results['outcome_details']:
-            self.results['outcome_details'][detail_key] = 0
-        self.results['outcome_details'][detail_key] += 1
+        # Track outcome frequencies, capping totals for the matrix
+        cell = min(player_value, MATRIX_CAP) * MATRIX_SIZE + min(dealer_value, MATRIX_CAP)
+        self._matrix_counts[cell] += 1
+        self._detail_counts[cell * len(RESULT_CODES) + result_index] += 1
         
         # Count total hands
-        self.results['total_bets'] += 1
+        results['total_bets'] += 1
     
-    def run_simulation(self):
+    def collect_outcome_counts(self):
+        """
+        Rebuild results['outcome_matrix'] and results['outcome_details'] from
+        the dense counters kept by update_statistics.
+        """
+        self.results['outcome_matrix'] = {
+            divmod(cell, MATRIX_SIZE): count
+            for cell, count in enumerate(self._matrix_counts) if count
+        }
+        
+        num_results = len(RESULT_CODES)
+        outcome_details = {}
+        for index, count in enumerate(self._detail_counts):
+            if count:
+                cell, result_index = divmod(index, num_results)
+                outcome_details[divmod(cell, MATRIX_SIZE) + (RESULT_CODES[result_index],)] = count
+        self.results['outcome_details'] = outcome_details
+    
+    def run_simulation(self, report_progress=True):
         """
         Run the configured number of blackjack hands.
         
+        Args:
+            report_progress (bool): Print a progress line roughly every 5% of the hands
+            
         Returns:
             dict: Simulation results including win/loss statistics
         """
         self.setup()
         
         start_time = time.time()
-        progress_interval = max(self.config.num_hands // 20, 1)  # Report progress ~20 times
+        if report_progress:
+            progress_interval = max(self.config.num_hands // 20, 1)  # Report progress ~20 times
+        else:
+            progress_interval = max(self.config.num_hands, 1)  # One chunk, no reports
         
-        for hand_num in range(self.config.num_hands):
-            # Initialize hands for this round
-            player_hands = [Hand() for _ in range(self.config.num_players)]
-            dealer_hand = Hand()
-            dealer_hand.is_dealer_hand = True
-            
-            # Deal initial cards
-            self.deal_initial_cards(player_hands, dealer_hand)
-            
-            # Process each player hand
-            used_cards = []
-            for player_hand in player_hands:
-                result, player_value, dealer_value = self.play_hand(player_hand, dealer_hand)
+        # Loop invariants, bound once instead of looked up on every hand
+        draw = self.shoe.draw
+        return_to_discard = self.shoe.return_to_discard
+        continuous_shuffle = self.shoe.continuous_shuffle
+        deal_initial_cards = self.deal_initial_cards
+        play_hand = self.play_hand
+        update_statistics = self.update_statistics
+        
+        # One hand per player plus the dealer's, cleared and reused for every round
+        player_hands = [Hand() for _ in range(self.config.num_players)]
+        dealer_hand = Hand()
+        dealer_hand.is_dealer_hand = True
+        # Most tables have one player, which gets an unrolled deal
+        only_hand = player_hands[0] if len(player_hands) == 1 else None
+        
+        # Play the hands in chunks of progress_interval, so the progress check runs once per chunk
+        num_hands = self.config.num_hands
+        for chunk_start in range(0, num_hands, progress_interval):
+            chunk_size = min(progress_interval, num_hands - chunk_start)
+            for _ in range(chunk_size):
+                dealer_hand.clear()
                 
-                # Update stats
-                self.update_statistics(result, player_value, dealer_value, player_hand, dealer_hand)
+                # Deal initial cards
+                if only_hand is not None:
+                    # Unrolled deal for a single player, in the same order as deal_initial_cards
+                    only_hand.clear()
+                    only_hand.add_card(draw())
+                    dealer_hand.add_card(draw())
+                    only_hand.add_card(draw())
+                    dealer_hand.add_card(draw())
+                else:
+                    for player_hand in player_hands:
+                        player_hand.clear()
+                    deal_initial_cards(player_hands, dealer_hand)
                 
-                # Collect used cards
-                used_cards.extend(player_hand.cards)
-            
-            # Add dealer cards to used pile
-            used_cards.extend(dealer_hand.cards)
+                # Process each player hand
+                for player_hand in player_hands:
+                    result, player_value, dealer_value = play_hand(player_hand, dealer_hand)
+                    
+                    # Update stats
+                    update_statistics(result, player_value, dealer_value, player_hand, dealer_hand)
+                    
+                # Return cards to shoe
+                if continuous_shuffle:
+                    # The whole shoe is reshuffled in place, so the used cards need not be collected
+                    return_to_discard(())
+                else:
+                    used_cards = []
+                    for player_hand in player_hands:
+                        used_cards.extend(player_hand.cards)
+                    used_cards.extend(dealer_hand.cards)
+                    return_to_discard(used_cards)
             
-            # Return cards to shoe
-            self.shoe.return_to_discard(used_cards)
-            
-            # Progress updates
-            if (hand_num + 1) % progress_interval == 0:
-                progress_pct = 100 * (hand_num + 1) / self.config.num_hands
+            # Progress updates, after each full chunk
+            if report_progress and chunk_size == progress_interval:
+                hands_done = chunk_start + chunk_size
+                progress_pct = 100 * hands_done / num_hands
                 elapsed = time.time() - start_time
-                est_total = elapsed / (hand_num + 1) * self.config.num_hands
+                est_total = elapsed / hands_done * num_hands
                 remaining = est_total - elapsed
                 
-                print(f"Progress: {progress_pct:.1f}% ({hand_num + 1}/{self.config.num_hands}) "
+                print(f"Progress: {progress_pct:.1f}% ({hands_done}/{num_hands}) "
                       f"- Est. time remaining: {remaining:.1f}s")
         
-        # Calculate final house edge
+        self.collect_outcome_counts()
+        self._calculate_edges()
+            
+        elapsed_time = time.time() - start_time
+        self.results['simulation_time'] = elapsed_time
+        
+        return self.results
+        
+    def run_simulation_parallel(self, n_workers=None, report_progress=True):
+        """
+        Run the configured number of hands split across worker processes.
+        
+        Hands are independent, so each worker runs this simulator's class on its
+        share with its own seeded shoe, and merge_results sums the counters.
+        
+        Args:
+            n_workers (int, optional): Number of worker processes (default: CPU count)
+            report_progress (bool): Print progress (one worker) or a summary line (several)
+            
+        Returns:
+            dict: Simulation results, as returned by run_simulation
+        """
+        num_hands = self.config.num_hands
+        n_workers = max(1, min(n_workers or os.cpu_count() or 1, num_hands))
+        if n_workers == 1:
+            return self.run_simulation(report_progress=report_progress)
+            
+        start_time = time.time()
+        
+        # Worker i gets seed + i, so a seeded simulator gives reproducible results
+        base_seed = self.seed if self.seed is not None else random.randrange(2**32)
+        base_hands, extra_hands = divmod(num_hands, n_workers)
+        chunks = [(type(self), self.config, base_hands + (1 if i < extra_hands else 0), base_seed + i)
+                  for i in range(n_workers)]
+        with multiprocessing.Pool(n_workers) as pool:
+            chunk_results = pool.starmap(_run_chunk, chunks)
+            
+        results = self.merge_results(chunk_results)
+        results['simulation_time'] = time.time() - start_time
+        
+        if report_progress:
+            print(f"Simulated {results['total_bets']} hands across {n_workers} workers "
+                  f"in {results['simulation_time']:.1f}s")
+        
+        return results
+        
+    def merge_results(self, chunk_results):
+        """
+        Replace the results with the sum of several chunks' results.
+        
+        Counters and count dicts are summed key by key; DERIVED_RESULTS are skipped
+        and recomputed from the totals by _calculate_edges.
+        
+        Args:
+            chunk_results (list): Results dicts returned by run_simulation of this class
+            
+        Returns:
+            dict: The merged results
+        """
+        # Start from zeroed counters and add every chunk's counts
+        self.setup()
+        results = self.results
+        for chunk in chunk_results:
+            for key, total in results.items():
+                if key in self.DERIVED_RESULTS:
+                    continue
+                if isinstance(total, dict):
+                    for sub_key, count in chunk[key].items():
+                        total[sub_key] = total.get(sub_key, 0) + count
+                else:
+                    results[key] = total + chunk[key]
+                    
+        self._calculate_edges()
+        return results
+        
+    def _calculate_edges(self):
+        """Set results['house_edge'] from the accumulated win, blackjack and loss counts."""
         if self.results['total_bets'] > 0:
             total_hands = self.results['total_bets']
             blackjack_hands = self.results['blackjacks']
@@ -262,7 +408,7 @@ class BlackjackSimulator:
             # Regular wins: Pay 1:1 with commission
             # Blackjack wins: Pay 3:2 with no commission
             # Losses: Lose entire bet
-            commission_mult = 1.0 - (self.config.commission_pct / 100.0)
+            commission_mult = self.config.commission_multiplier
             expected_value = (reg_win_rate * commission_mult)  # Regular wins after commission
             expected_value += (blackjack_rate * self.config.blackjack_payout)  # Blackjack wins
             expected_value -= lose_rate  # Losses
@@ -271,11 +417,6 @@ class BlackjackSimulator:
             self.results['house_edge'] = -expected_value * 100
         else:
             self.results['house_edge'] = 0
-            
-        elapsed_time = time.time() - start_time
-        self.results['simulation_time'] = elapsed_time
-        
-        return self.results
 
     def get_results_summary(self):
         """
@@ -27,14 +27,14 @@ class DealerStrategy(BaseStrategy):
         Returns:
             bool: True if the dealer should hit, False otherwise
         """
-        hand_value = player_hand.get_value()
+        hand_value, is_soft = player_hand.get_value_and_soft()
         
         # Always hit if below 17
         if hand_value < 17:
             return True
             
         # Hit on soft 17 if that's the rule
-        if hand_value == 17 and player_hand.is_soft() and self.hit_soft_17:
+        if hand_value == 17 and is_soft and self.hit_soft_17:
             return True
             
         # Stand in all other cases
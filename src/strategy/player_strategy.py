@@ -1,5 +1,10 @@
 from src.strategy.base_strategy import BaseStrategy
 
+# Dealer up card values run from 2 to 11 (Ace)
+MAX_CARD_VALUE = 11
+# Hand totals covered by the decision table; a hand can reach at most 21 + 10
+MAX_HAND_VALUE = 31
+
 class PlayerStrategy(BaseStrategy):
     """
     Configurable player strategy for blackjack simulation.
@@ -21,37 +26,100 @@ class PlayerStrategy(BaseStrategy):
         self.stand_threshold = stand_threshold
         self.hit_soft_17 = hit_soft_17
         self.hit_rules = hit_rules or {}
+        self._decisions = self._build_decision_table(*self._build_rule_tables(self.hit_rules))
         
-    def should_hit(self, player_hand, dealer_up_card=None):
+    @staticmethod
+    def _build_rule_tables(hit_rules):
         """
-        Determine if the player should hit based on configured rules.
+        Compile hit rules into dense [player_total][dealer_value] tables.
         
         Args:
-            player_hand (Hand): The player's current hand
-            dealer_up_card (Card, optional): The dealer's up card
+            hit_rules (dict): Hit rules in the format accepted by __init__
             
         Returns:
-            bool: True if the player should hit, False otherwise
+            tuple: (hard_rules, soft_rules) lists of lists holding the hit decision,
+            or None where no rule is specified
         """
-        hand_value = player_hand.get_value()
+        parsed_rules = []
+        for key, should_hit in hit_rules.items():
+            if not isinstance(key, tuple) or len(key) != 2:
+                continue
+            total, dealer_value = key
+            is_soft = isinstance(total, str) and total.startswith("soft ")
+            if is_soft:
+                total = total[len("soft "):]
+                if not total.isdigit():
+                    continue
+                total = int(total)
+            
+            # Rules for totals or dealer values no hand can have never match
+            if isinstance(total, int) and isinstance(dealer_value, int) \
+                    and total >= 0 and 0 <= dealer_value <= MAX_CARD_VALUE:
+                parsed_rules.append((is_soft, total, dealer_value, should_hit))
+        
+        num_totals = max((total for _, total, _, _ in parsed_rules), default=0) + 1
+        hard_rules = [[None] * (MAX_CARD_VALUE + 1) for _ in range(num_totals)]
+        soft_rules = [[None] * (MAX_CARD_VALUE + 1) for _ in range(num_totals)]
+        for is_soft, total, dealer_value, should_hit in parsed_rules:
+            (soft_rules if is_soft else hard_rules)[total][dealer_value] = should_hit
         
-        # Check for specific rules for this scenario
-        if dealer_up_card and self.hit_rules:
-            dealer_value = dealer_up_card.get_value()
+        return hard_rules, soft_rules
+        
+    def _build_decision_table(self, hard_rules, soft_rules):
+        """
+        Resolve every hit decision up front into a [is_soft][player_total][dealer_value] table.
+        
+        Dealer value 0 stands for "no up card", where only the default rules apply.
+        
+        Args:
+            hard_rules (list): Hard-hand rule table from _build_rule_tables
+            soft_rules (list): Soft-hand rule table from _build_rule_tables
             
-            # Check for hard hand specific rule
-            if not player_hand.is_soft() and (hand_value, dealer_value) in self.hit_rules:
-                return self.hit_rules[(hand_value, dealer_value)]
-                
-            # Check for soft hand specific rule
-            if player_hand.is_soft() and (f"soft {hand_value}", dealer_value) in self.hit_rules:
-                return self.hit_rules[(f"soft {hand_value}", dealer_value)]
-        
-        # Default rules if no specific rule matches
+        Returns:
+            tuple: (hard_decisions, soft_decisions) lists of lists of hit decisions
+        """
+        num_totals = max(MAX_HAND_VALUE + 1, len(hard_rules))
+        decisions = []
+        for is_soft, rules in ((False, hard_rules), (True, soft_rules)):
+            table = []
+            for hand_value in range(num_totals):
+                default = self._default_should_hit(hand_value, is_soft)
+                row = [default] * (MAX_CARD_VALUE + 1)
+                if hand_value < len(rules):
+                    for dealer_value in range(1, MAX_CARD_VALUE + 1):
+                        rule = rules[hand_value][dealer_value]
+                        if rule is not None:
+                            row[dealer_value] = rule
+                table.append(row)
+            decisions.append(table)
+        return tuple(decisions)
+        
+    def _default_should_hit(self, hand_value, is_soft):
+        """Hit decision when no specific rule applies."""
         if hand_value < self.stand_threshold:
             return True
             
-        if hand_value == 17 and player_hand.is_soft() and self.hit_soft_17:
+        if hand_value == 17 and is_soft and self.hit_soft_17:
             return True
             
-        return False
\ No newline at end of file
+        return False
+        
+    def should_hit(self, player_hand, dealer_up_card=None):
+        """
+        Determine if the player should hit based on configured rules.
+        
+        Args:
+            player_hand (Hand): The player's current hand
+            dealer_up_card (Card, optional): The dealer's up card
+            
+        Returns:
+            bool: True if the player should hit, False otherwise
+        """
+        hand_value, is_soft = player_hand.get_value_and_soft()
+        
+        # Specific rules and defaults are already merged into the decision table
+        table = self._decisions[is_soft]
+        if hand_value < len(table):
+            return table[hand_value][dealer_up_card.get_value() if dealer_up_card else 0]
+        
+        return self._default_should_hit(hand_value, is_soft)
\ No newline at end of file
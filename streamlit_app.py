@@ -1,21 +1,28 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
 import json
 import sys
 import time
 import csv
+import re
+from collections import Counter
 from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(_BASE_DIR, 'results')
+CONFIG_DIR = os.path.join(_BASE_DIR, 'config')
+
+sys.path.insert(0, _BASE_DIR)
 
 from src.simulation.config import SimulationConfig
 from src.simulation.simulator import BlackjackSimulator
 from src.simulation.interactive_simulator import InteractiveSimulator
 from src.simulation.sidebet_simulator import SidebetSimulator, InteractiveSidebetSimulator
-from src.reporting.report_generator import ReportGenerator
+from src.reporting.report_generator import ReportGenerator, RESULT_LABELS
+from src.reporting.json_io import load_json, dump_json
 
 # Custom CSS for card styling
 def load_custom_css():
@@ -126,15 +133,13 @@ class StreamlitReportGenerator:
         """
         self.results = results
         self.config = config
-        self.results_dir = os.path.join(os.getcwd(), 'results')
+        self.results_dir = RESULTS_DIR
+        os.makedirs(self.results_dir, exist_ok=True)
         
     def generate_summary(self, filename):
         """Generate a summary report of the results"""
         if not self.results:
             raise ValueError("No simulation results available to report")
-
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
             
         filepath = os.path.join(self.results_dir, filename)
 
@@ -207,9 +212,6 @@ class StreamlitReportGenerator:
         """Generate a CSV file with the outcome matrix data"""
         if not self.results:
             raise ValueError("No simulation results available to report")
-
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
             
         filepath = os.path.join(self.results_dir, filename)
         
@@ -251,17 +253,13 @@ class StreamlitReportGenerator:
         if not self.results:
             raise ValueError("No simulation results available to report")
             
-
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
-            
         filepath = os.path.join(self.results_dir, filename)
         
         outcome_details = self.results['outcome_details']
         
         detailed_data = []
         for (player_total, dealer_total, result), count in outcome_details.items():
-            win_loss = "Win" if result == "player_win" else ("Loss" if result == "dealer_win" else "Push")
+            win_loss = RESULT_LABELS.get(result, "Push")
             
             entry = {
                 'player_total': player_total,
@@ -295,7 +293,7 @@ class StreamlitReportGenerator:
         detailed_data = []
         
         for (player_total, dealer_total, result), count in outcome_details.items():
-            win_loss = "Win" if result == "player_win" else ("Loss" if result == "dealer_win" else "Push")
+            win_loss = RESULT_LABELS.get(result, "Push")
             
             for _ in range(count):
                 detailed_data.append({
@@ -307,41 +305,70 @@ class StreamlitReportGenerator:
     
         return pd.DataFrame(detailed_data)
     
+    def get_outcome_counts(self):
+        """Count hands per outcome label straight from the aggregated outcome data"""
+        if not self.results:
+            raise ValueError("No simulation results available to report")
+            
+        counts = {}
+        for (player_total, dealer_total, result), count in self.results['outcome_details'].items():
+            win_loss = RESULT_LABELS.get(result, "Push")
+            counts[win_loss] = counts.get(win_loss, 0) + count
+        
+        return pd.Series(counts, name="count").sort_values(ascending=False)
+    
+    def get_matrix_pivot(self):
+        """Build the player total x dealer total frequency matrix from the outcome matrix"""
+        if not self.results:
+            raise ValueError("No simulation results available to report")
+            
+        outcome_matrix = self.results['outcome_matrix']
+        counts = pd.Series(
+            list(outcome_matrix.values()),
+            index=pd.MultiIndex.from_tuples(list(outcome_matrix.keys()), names=["player_total", "dealer_total"])
+        )
+        return counts.unstack(fill_value=0).sort_index().sort_index(axis=1)
+    
+    def get_outcome_score_pivot(self):
+        """Mean outcome (1=win, 0=push, -1=loss) per player total x dealer total from the outcome data"""
+        if not self.results:
+            raise ValueError("No simulation results available to report")
+            
+        score_sums = {}
+        hand_counts = {}
+        for (player_total, dealer_total, result), count in self.results['outcome_details'].items():
+            score = 1 if result == "player_win" else (-1 if result == "dealer_win" else 0)
+            key = (player_total, dealer_total)
+            score_sums[key] = score_sums.get(key, 0) + score * count
+            hand_counts[key] = hand_counts.get(key, 0) + count
+        
+        mean_scores = pd.Series(
+            [score_sums[key] / hand_counts[key] for key in score_sums],
+            index=pd.MultiIndex.from_tuples(list(score_sums.keys()), names=["player_total", "dealer_total"])
+        )
+        return mean_scores.unstack(fill_value=0).sort_index().sort_index(axis=1)
+    
     def generate_detailed_push_matrix_csv(self, filename):
         """Generate a CSV file with detailed push statistics correlating hand total and card count"""
         if not self.results or 'pushes_detail_matrix' not in self.results:
             raise ValueError("No push detail matrix available in the results")
-
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
             
         filepath = os.path.join(self.results_dir, filename)
         
-        # Get all unique hand values and card counts
-        hand_values = set()
-        card_counts = set()
+        pushes_detail_matrix = self.results['pushes_detail_matrix']
         
-        for (value, count) in self.results['pushes_detail_matrix'].keys():
-            hand_values.add(value)
-            card_counts.add(count)
+        # Collect the unique hand values and card counts in one pass (dicts keep them de-duplicated)
+        hand_values = {}
+        card_counts = {}
+        for (value, count) in pushes_detail_matrix:
+            hand_values[value] = None
+            card_counts[count] = None
             
-        # Sort the values and counts for better readability
-        # Convert to list and sort
-        hand_values = sorted([v for v in hand_values if isinstance(v, int)] + 
-                            [v for v in hand_values if not isinstance(v, int)],
-                            key=lambda x: float('inf') if not isinstance(x, int) else x)
-        
-        # Sort card counts with integers first (in numeric order) followed by non-integers
-        int_counts = sorted([c for c in card_counts if isinstance(c, int)])
-        non_int_counts = sorted([c for c in card_counts if not isinstance(c, int)])
-        card_counts = int_counts + non_int_counts
-        
-        # Create a 2D matrix representation
-        matrix = {}
-        for value in hand_values:
-            matrix[value] = {}
-            for count in card_counts:
-                matrix[value][count] = self.results['pushes_detail_matrix'].get((value, count), 0)
+        # Sort integers numerically, followed by the other labels (e.g. 'bust', '12+') alphabetically
+        hand_values = (sorted(v for v in hand_values if isinstance(v, int)) +
+                       sorted((v for v in hand_values if not isinstance(v, int)), key=str))
+        card_counts = (sorted(c for c in card_counts if isinstance(c, int)) +
+                       sorted((c for c in card_counts if not isinstance(c, int)), key=str))
         
         with open(filepath, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
@@ -349,11 +376,11 @@ class StreamlitReportGenerator:
             header = ['Hand Value\\Card Count'] + [str(count) for count in card_counts]
             writer.writerow(header)
             
-            for value in hand_values:
-                row = [str(value)]
-                for count in card_counts:
-                    row.append(matrix[value][count])
-                writer.writerow(row)
+            # Build each row straight from the push counts and hand them to the csv writer in one call
+            writer.writerows(
+                [str(value)] + [pushes_detail_matrix.get((value, count), 0) for count in card_counts]
+                for value in hand_values
+            )
                 
         print(f"Detailed push matrix saved to {filepath}")
         return filepath
@@ -406,45 +433,177 @@ and game dynamics under various rule configurations. You can adjust parameters,
 run simulations, and visualize the results.
 """)
 
+@st.cache_data(show_spinner=False)
+def _parse_config(path, mtime_ns):
+    """Parse a config file; mtime_ns is only used as a cache key"""
+    with open(path, 'rb') as f:
+        return load_json(f)
+
+# Compact dtypes for the detailed CSV: totals are capped at 30 and result has three labels
+DETAILED_CSV_DTYPES = {'result': 'category', 'player_total': 'int8', 'dealer_total': 'int8'}
+
+def _read_config(path):
+    """Return the parsed config at path, or None if the file does not exist"""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _parse_config(path, mtime_ns)
+
+def _plotting_libs():
+    """Import matplotlib and seaborn when a view first draws a figure; the default views use Streamlit charts"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
+
+@st.cache_data(show_spinner=False)
+def _load_detailed_csv(path, mtime_ns):
+    """Read a detailed results CSV into a DataFrame; mtime_ns is only used as a cache key"""
+    try:
+        return pd.read_csv(path, dtype=DETAILED_CSV_DTYPES, engine="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow is optional, and pandas before 1.4 rejects the engine name with
+        # ValueError; fall back to the default C parser
+        return pd.read_csv(path, dtype=DETAILED_CSV_DTYPES)
+
+@st.cache_data(show_spinner=False)
+def _outcome_counts(path, mtime_ns):
+    """Count rows per outcome in a detailed results CSV"""
+    outcomes = _load_detailed_csv(path, mtime_ns)["result"].value_counts().reset_index()
+    outcomes.columns = ["Outcome", "Count"]
+    return outcomes
+
+@st.cache_data(show_spinner=False)
+def _outcome_pct_by_player_total(path, mtime_ns):
+    """Percentage of each outcome per player total in a detailed results CSV"""
+    pivot_data = _load_detailed_csv(path, mtime_ns).pivot_table(
+        index="player_total", 
+        columns="result", 
+        aggfunc="size", 
+        fill_value=0,
+        observed=True
+    )
+    return pivot_data.div(pivot_data.sum(axis=1), axis=0) * 100
+
+# One custom hit rule: "<hard|soft>:<total>:[<dealer cards separated by |>,]<action>"
+_RULE_RE = re.compile(r'\s*(hard|soft)\s*:\s*(\d+)\s*:\s*(?:(\d+(?:\s*\|\s*\d+)*)\s*,\s*)?(\w+)\s*', re.IGNORECASE)
+_TRUE_ACTIONS = frozenset({'hit', 'h', 'true', 't', 'yes', 'y', '1'})
+_ALL_DEALER_CARDS = tuple(range(2, 12))
+
+def _aggregate_detailed_csv(path, chunksize=200_000):
+    """Stream the result and total columns of a detailed results CSV and count values per column"""
+    result_counts, player_totals, dealer_totals = Counter(), Counter(), Counter()
+    for chunk in pd.read_csv(path, usecols=list(DETAILED_CSV_DTYPES), dtype=DETAILED_CSV_DTYPES, chunksize=chunksize):
+        result_counts.update(chunk["result"].value_counts().to_dict())
+        player_totals.update(chunk["player_total"].value_counts().to_dict())
+        dealer_totals.update(chunk["dealer_total"].value_counts().to_dict())
+    return result_counts, player_totals, dealer_totals
+
+@st.cache_data(show_spinner=False)
+def _detailed_counts(path, mtime_ns):
+    """Row counts per outcome plus bust counts for a detailed results CSV"""
+    result_counts, player_totals, dealer_totals = _aggregate_detailed_csv(path)
+    return {
+        "total_hands": sum(result_counts.values()),
+        "player_wins": int(result_counts.get("Win", 0)),
+        "dealer_wins": int(result_counts.get("Loss", 0)),
+        "pushes": int(result_counts.get("Push", 0)),
+        "player_busts": int(sum(n for total, n in player_totals.items() if total > 21)),
+        "dealer_busts": int(sum(n for total, n in dealer_totals.items() if total > 21))
+    }
+
+def parse_custom_hit_rules(rules_str):
+    """Parse custom hit rules text into a {(player_total, dealer_card): should_hit} dict"""
+    hit_rules_dict = {}
+    for rule in rules_str.split(';'):
+        if not rule.strip():
+            continue
+        
+        match = _RULE_RE.fullmatch(rule)
+        if not match:
+            st.warning(f"Skipping invalid rule format: {rule}")
+            continue
+        
+        hand_type, total, dealer_card_str, action = match.groups()
+        if dealer_card_str:
+            dealer_cards = [int(c.strip()) for c in dealer_card_str.split('|')]
+        else:
+            dealer_cards = _ALL_DEALER_CARDS
+        
+        should_hit = action.lower() in _TRUE_ACTIONS
+        player_key = int(total) if hand_type.lower() == 'hard' else f"soft {total}"
+        hit_rules_dict.update({(player_key, dealer_card): should_hit for dealer_card in dealer_cards})
+    
+    return hit_rules_dict
+
 def load_configs():
     """Load all saved configurations from the config directory"""
     configs = []
     try:
-        config_dir = "config"
-        if os.path.exists(config_dir):
-            for filename in os.listdir(config_dir):
+        if os.path.exists(CONFIG_DIR):
+            for filename in os.listdir(CONFIG_DIR):
                 if filename.endswith('.json'):
-                    with open(os.path.join(config_dir, filename), 'r') as f:
+                    with open(os.path.join(CONFIG_DIR, filename), 'r') as f:
                         configs.append(json.load(f))
     except Exception as e:
         st.error(f"Error loading saved configurations: {e}")
     return configs
 
+def _path_mtime_ns(path):
+    """Return the modification time of a file or directory, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def _list_file_names(path):
+    """Return the set of regular file names in a directory using a single scandir pass"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _scan_simulation_results(results_dir, config_dir, results_mtime_ns, config_mtime_ns):
+    """Build the results index; the mtime arguments only serve as cache keys"""
+    results = []
+    result_names = _list_file_names(results_dir)
+    config_names = _list_file_names(config_dir)
+    for filename in result_names:
+        if filename.startswith('blackjack_sim_summary_') and filename.endswith('.txt'):
+            timestamp = filename.replace('blackjack_sim_summary_', '').replace('.txt', '')
+            matrix_file = f"blackjack_sim_matrix_{timestamp}.csv"
+            detailed_file = f"blackjack_sim_detailed_{timestamp}.csv"
+            config_file = f"simulation_config_{timestamp}.json"
+            
+            result_entry = {
+                'timestamp': timestamp,
+                'summary_file': filename,
+                'matrix_file': matrix_file if matrix_file in result_names else None,
+                'detailed_file': detailed_file if detailed_file in result_names else None,
+                'config_file': config_file if config_file in config_names else None,
+            }
+            results.append(result_entry)
+    
+    results.sort(key=lambda x: x['timestamp'], reverse=True)
+    return results
+
 def load_simulation_results():
     """Load all simulation results from the results directory"""
     results = []
     try:
-        results_dir = "results"
-        if os.path.exists(results_dir):
-            for filename in os.listdir(results_dir):
-                if filename.startswith('blackjack_sim_summary_') and filename.endswith('.txt'):
-                    timestamp = filename.replace('blackjack_sim_summary_', '').replace('.txt', '')
-                    matrix_file = f"blackjack_sim_matrix_{timestamp}.csv"
-                    detailed_file = f"blackjack_sim_detailed_{timestamp}.csv"
-                    config_file = f"simulation_config_{timestamp}.json"
-                    
-                    result_entry = {
-                        'timestamp': timestamp,
-                        'summary_file': filename,
-                        'matrix_file': matrix_file if os.path.exists(os.path.join(results_dir, matrix_file)) else None,
-                        'detailed_file': detailed_file if os.path.exists(os.path.join(results_dir, detailed_file)) else None,
-                        'config_file': config_file if os.path.exists(os.path.join("config", config_file)) else None,
-                    }
-                    results.append(result_entry)
+        mtimes = (_path_mtime_ns(RESULTS_DIR), _path_mtime_ns(CONFIG_DIR))
+        # Reuse this session's index until either directory changes, so reruns skip
+        # the cache lookup and the copy st.cache_data hands back
+        if st.session_state.get("_results_index_mtimes") == mtimes:
+            return st.session_state["_results_index"]
+        results = _scan_simulation_results(RESULTS_DIR, CONFIG_DIR, *mtimes)
+        st.session_state["_results_index"] = results
+        st.session_state["_results_index_mtimes"] = mtimes
     except Exception as e:
         st.error(f"Error loading simulation results: {e}")
     
-    results.sort(key=lambda x: x['timestamp'], reverse=True)
     return results
 
 tab1, tab2, tab3, tab4, tab5 = st.tabs(["Run Simulation", "Hand-by-Hand Simulation", "Sidebet Simulation", "Data Visualization", "Previous Results"])
@@ -553,32 +712,7 @@ with tab1:
         hit_rules_dict = {}
         if config.get("custom_hit_rules"):
             try:
-                for rule in config["custom_hit_rules"].split(';'):
-                    if not rule:
-                        continue
-                    components = rule.strip().split(':')
-                    if len(components) < 3:
-                        st.warning(f"Skipping invalid rule format: {rule}")
-                        continue
-                    
-                    hand_type = components[0].lower()  # "hard" or "soft"
-                    total = components[1]  # player total
-                    dealer_cards_action = components[2]  # dealer cards and action
-                    
-                    if ',' in dealer_cards_action:
-                        dealer_card_str, action = dealer_cards_action.split(',')
-                        dealer_cards = [int(c) for c in dealer_card_str.split('|')]
-                    else:
-                        dealer_cards = list(range(2, 12))  # All possible dealer cards
-                        action = dealer_cards_action
-                    
-                    should_hit = action.lower() in ('hit', 'h', 'true', 't', 'yes', 'y', '1')
-                    
-                    for dealer_card in dealer_cards:
-                        if hand_type == 'hard':
-                            hit_rules_dict[(int(total), dealer_card)] = should_hit
-                        else:
-                            hit_rules_dict[(f"soft {total}", dealer_card)] = should_hit
+                hit_rules_dict = parse_custom_hit_rules(config["custom_hit_rules"])
             except Exception as e:
                 st.warning(f"Error parsing custom hit rules: {e}. Default rules will be used.")
         
@@ -597,10 +731,10 @@ with tab1:
         )
         
         if config["save_results"]:
-            os.makedirs("config", exist_ok=True)
-            config_file = f"config/simulation_config_{timestamp}.json"
-            with open(config_file, "w") as f:
-                json.dump(sim_config.to_dict(), f, indent=4)
+            os.makedirs(CONFIG_DIR, exist_ok=True)
+            config_file = os.path.join(CONFIG_DIR, f"simulation_config_{timestamp}.json")
+            with open(config_file, "wb") as f:
+                dump_json(sim_config.to_dict(), f)
         
         simulator = BlackjackSimulator(sim_config)
         start_time = time.time()
@@ -611,10 +745,15 @@ with tab1:
         report_generator = StreamlitReportGenerator(results, sim_config)
         
         if config["save_results"]:
-            os.makedirs("results", exist_ok=True)
-            report_generator.generate_detailed_csv(f"blackjack_sim_detailed_{timestamp}.csv")
-            report_generator.generate_matrix_csv(f"blackjack_sim_matrix_{timestamp}.csv")
-            report_generator.generate_summary(f"blackjack_sim_summary_{timestamp}.txt")
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(report_generator.generate_detailed_csv, f"blackjack_sim_detailed_{timestamp}.csv"),
+                    executor.submit(report_generator.generate_matrix_csv, f"blackjack_sim_matrix_{timestamp}.csv"),
+                    executor.submit(report_generator.generate_summary, f"blackjack_sim_summary_{timestamp}.txt"),
+                ]
+                for future in futures:
+                    future.result()
         
         total_hands = results['total_bets']
         # Raw percentages
@@ -660,6 +799,9 @@ with tab1:
         if config["generate_visuals"]:
             detailed_results_df = report_generator.get_detailed_dataframe()
             summary_data["detailed_df"] = detailed_results_df
+            summary_data["outcome_counts"] = report_generator.get_outcome_counts()
+            summary_data["matrix_pivot"] = report_generator.get_matrix_pivot()
+            summary_data["outcome_score_pivot"] = report_generator.get_outcome_score_pivot()
         
         return summary_data
 
@@ -916,32 +1058,7 @@ with tab2:
             hit_rules_dict = {}
             if custom_hit_rules:
                 try:
-                    for rule in custom_hit_rules.split(';'):
-                        if not rule:
-                            continue
-                        components = rule.strip().split(':')
-                        if len(components) < 3:
-                            st.warning(f"Skipping invalid rule format: {rule}")
-                            continue
-                        
-                        hand_type = components[0].lower()  # "hard" or "soft"
-                        total = components[1]  # player total
-                        dealer_cards_action = components[2]  # dealer cards and action
-                        
-                        if ',' in dealer_cards_action:
-                            dealer_card_str, action = dealer_cards_action.split(',')
-                            dealer_cards = [int(c) for c in dealer_card_str.split('|')]
-                        else:
-                            dealer_cards = list(range(2, 12))  # All possible dealer cards
-                            action = dealer_cards_action
-                        
-                        should_hit = action.lower() in ('hit', 'h', 'true', 't', 'yes', 'y', '1')
-                        
-                        for dealer_card in dealer_cards:
-                            if hand_type == 'hard':
-                                hit_rules_dict[(int(total), dealer_card)] = should_hit
-                            else:
-                                hit_rules_dict[(f"soft {total}", dealer_card)] = should_hit
+                    hit_rules_dict = parse_custom_hit_rules(custom_hit_rules)
                 except Exception as e:
                     st.warning(f"Error parsing custom hit rules: {e}. Default rules will be used.")
             
@@ -1252,138 +1369,141 @@ with tab3:
     You can choose to have payouts based on either the total hand value or the total number of cards.
     """)
     
-    col1, col2 = st.columns(2)
+    st.markdown("### Sidebet Configuration")
     
-    with col1:
-        st.markdown("### Sidebet Configuration")
-        
-        sidebet_mode = st.radio(
-            "Payout Mode",
-            options=["Hand Total", "Card Count"],
-            index=0,
-            help="Choose to pay based on the total value of the hand or the total number of cards between player and dealer"
-        )
-        
-        # Convert to the mode string used in the config
-        sidebet_payout_mode = "total" if sidebet_mode == "Hand Total" else "cards"
-        
-        st.markdown("### Game Rules")
-        
-        num_hands = st.number_input(
-            "Number of Hands to Simulate", 
-            min_value=100, 
-            max_value=100000000, 
-            value=10000,
-            step=1000,
-            key="sidebet_num_hands"
-        )
+    # The payout mode decides which payout inputs are shown, so it lives outside the form
+    sidebet_mode = st.radio(
+        "Payout Mode",
+        options=["Hand Total", "Card Count"],
+        index=0,
+        help="Choose to pay based on the total value of the hand or the total number of cards between player and dealer"
+    )
+    
+    # Convert to the mode string used in the config
+    sidebet_payout_mode = "total" if sidebet_mode == "Hand Total" else "cards"
+    
+    # The shuffle method decides whether the threshold input is shown, so it also lives outside the form
+    shuffle_method = st.selectbox(
+        "Shuffle Method",
+        options=["Reshuffle at threshold", "Continuous shuffle"],
+        index=0,
+        key="sidebet_shuffle_method"
+    )
+    
+    with st.form("sidebet_simulation_config"):
+        col1, col2 = st.columns(2)
         
-        num_decks = st.number_input(
-            "Number of Decks", 
-            min_value=1, 
-            max_value=8, 
-            value=6,
-            key="sidebet_num_decks"
-        )
+        with col1:
+            st.markdown("### Game Rules")
         
-        player_hits_soft_17 = st.checkbox("Player Hits Soft 17", value=False, key="sidebet_player_hits_soft17")
-        dealer_hits_soft_17 = st.checkbox("Dealer Hits Soft 17", value=False, key="sidebet_dealer_hits_soft17")
+            num_hands = st.number_input(
+                "Number of Hands to Simulate", 
+                min_value=100, 
+                max_value=100000000, 
+                value=10000,
+                step=1000,
+                key="sidebet_num_hands"
+            )
         
-        num_players = st.number_input(
-            "Number of Players",
-            min_value=1,
-            max_value=7,
-            value=1,
-            key="sidebet_num_players"
-        )
+            num_decks = st.number_input(
+                "Number of Decks", 
+                min_value=1, 
+                max_value=8, 
+                value=6,
+                key="sidebet_num_decks"
+            )
         
-        hit_against_blackjack = st.checkbox(
-            "Allow Hit Against Dealer Blackjack", 
-            value=False,
-            help="If checked, player can continue to hit when dealer has blackjack (will not result in a push if 21 is reached)"
-        )
+            player_hits_soft_17 = st.checkbox("Player Hits Soft 17", value=False, key="sidebet_player_hits_soft17")
+            dealer_hits_soft_17 = st.checkbox("Dealer Hits Soft 17", value=False, key="sidebet_dealer_hits_soft17")
         
-        shuffle_method = st.selectbox(
-            "Shuffle Method",
-            options=["Reshuffle at threshold", "Continuous shuffle"],
-            index=0,
-            key="sidebet_shuffle_method"
-        )
+            num_players = st.number_input(
+                "Number of Players",
+                min_value=1,
+                max_value=7,
+                value=1,
+                key="sidebet_num_players"
+            )
         
-        if shuffle_method == "Reshuffle at threshold":
-            reshuffle_threshold = st.number_input(
-                "Reshuffle Threshold (cards remaining)", 
-                min_value=0, 
-                max_value=104, 
-                value=52,
-                key="sidebet_reshuffle_threshold"
+            hit_against_blackjack = st.checkbox(
+                "Allow Hit Against Dealer Blackjack", 
+                value=False,
+                help="If checked, player can continue to hit when dealer has blackjack (will not result in a push if 21 is reached)"
             )
-        else:
-            reshuffle_threshold = 0
+        
+            if shuffle_method == "Reshuffle at threshold":
+                reshuffle_threshold = st.number_input(
+                    "Reshuffle Threshold (cards remaining)", 
+                    min_value=0, 
+                    max_value=104, 
+                    value=52,
+                    key="sidebet_reshuffle_threshold"
+                )
+            else:
+                reshuffle_threshold = 0
     
-    with col2:
-        st.markdown("### Payout Configuration")
-        
-        if sidebet_mode == "Hand Total":
-            # Hand total payouts
-            st.markdown("#### Payout Multipliers by Hand Total")
-            col_a, col_b = st.columns(2)
-            
-            with col_a:
-                payout_17 = st.number_input("17 vs 17 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_18 = st.number_input("18 vs 18 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_19 = st.number_input("19 vs 19 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_bust = st.number_input("Bust vs Bust Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-            
-            with col_b:
-                payout_20 = st.number_input("20 vs 20 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_21 = st.number_input("21 vs 21 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_bj = st.number_input("Blackjack vs Blackjack Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-            
-            sidebet_payouts = {
-                17: payout_17,
-                18: payout_18,
-                19: payout_19,
-                20: payout_20,
-                21: payout_21,
-                'bust-bust': payout_bust,
-                'blackjack-blackjack': payout_bj
-            }
-        else:
-            # Card count payouts
-            st.markdown("#### Payout Multipliers by Card Count")
-            col_a, col_b = st.columns(2)
-            
-            with col_a:
-                payout_4 = st.number_input("4 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_5 = st.number_input("5 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_6 = st.number_input("6 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_7 = st.number_input("7 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_8 = st.number_input("8 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-            
-            with col_b:
-                payout_9 = st.number_input("9 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_10 = st.number_input("10 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_11 = st.number_input("11 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-                payout_12plus = st.number_input("12+ Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
-            
-            sidebet_payouts = {
-                4: payout_4,
-                5: payout_5,
-                6: payout_6,
-                7: payout_7,
-                8: payout_8,
-                9: payout_9,
-                10: payout_10,
-                11: payout_11,
-                '12+': payout_12plus
-            }
+        with col2:
+            st.markdown("### Payout Configuration")
         
-        st.markdown("### Simulation Options")
-        save_results = st.checkbox("Save Simulation Results", value=True, key="sidebet_save_results")
-        generate_visuals = st.checkbox("Generate Visualizations", value=True, key="sidebet_generate_visuals")
+            if sidebet_mode == "Hand Total":
+                # Hand total payouts
+                st.markdown("#### Payout Multipliers by Hand Total")
+                col_a, col_b = st.columns(2)
+            
+                with col_a:
+                    payout_17 = st.number_input("17 vs 17 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_18 = st.number_input("18 vs 18 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_19 = st.number_input("19 vs 19 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_bust = st.number_input("Bust vs Bust Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+            
+                with col_b:
+                    payout_20 = st.number_input("20 vs 20 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_21 = st.number_input("21 vs 21 Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_bj = st.number_input("Blackjack vs Blackjack Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+            
+                sidebet_payouts = {
+                    17: payout_17,
+                    18: payout_18,
+                    19: payout_19,
+                    20: payout_20,
+                    21: payout_21,
+                    'bust-bust': payout_bust,
+                    'blackjack-blackjack': payout_bj
+                }
+            else:
+                # Card count payouts
+                st.markdown("#### Payout Multipliers by Card Count")
+                col_a, col_b = st.columns(2)
+            
+                with col_a:
+                    payout_4 = st.number_input("4 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_5 = st.number_input("5 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_6 = st.number_input("6 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_7 = st.number_input("7 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_8 = st.number_input("8 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+            
+                with col_b:
+                    payout_9 = st.number_input("9 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_10 = st.number_input("10 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_11 = st.number_input("11 Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+                    payout_12plus = st.number_input("12+ Cards Payout (X:1)", min_value=0, max_value=100, value=1, step=1)
+            
+                sidebet_payouts = {
+                    4: payout_4,
+                    5: payout_5,
+                    6: payout_6,
+                    7: payout_7,
+                    8: payout_8,
+                    9: payout_9,
+                    10: payout_10,
+                    11: payout_11,
+                    '12+': payout_12plus
+                }
+        
+            st.markdown("### Simulation Options")
+            save_results = st.checkbox("Save Simulation Results", value=True, key="sidebet_save_results")
+            generate_visuals = st.checkbox("Generate Visualizations", value=True, key="sidebet_generate_visuals")
     
-    run_sidebet_sim = st.button("Run Sidebet Simulation", type="primary", use_container_width=True)
+        run_sidebet_sim = st.form_submit_button("Run Sidebet Simulation", type="primary", use_container_width=True)
     
     if run_sidebet_sim:
         with st.spinner('Running sidebet simulation... This may take a moment.'):
@@ -1403,10 +1523,10 @@ with tab3:
             # Save config if requested
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             if save_results:
-                os.makedirs("config", exist_ok=True)
-                config_file = f"config/sidebet_config_{timestamp}.json"
-                with open(config_file, "w") as f:
-                    json.dump(sim_config.to_dict(), f, indent=4)
+                os.makedirs(CONFIG_DIR, exist_ok=True)
+                config_file = os.path.join(CONFIG_DIR, f"sidebet_config_{timestamp}.json")
+                with open(config_file, "wb") as f:
+                    dump_json(sim_config.to_dict(), f)
             
             # Run the simulation
             simulator = SidebetSimulator(sim_config)
@@ -1419,12 +1539,18 @@ with tab3:
             report_generator = StreamlitReportGenerator(results, sim_config)
             
             if save_results:
-                os.makedirs("results", exist_ok=True)
-                report_generator.generate_detailed_csv(f"sidebet_sim_detailed_{timestamp}.csv")
-                report_generator.generate_matrix_csv(f"sidebet_sim_matrix_{timestamp}.csv")
-                report_generator.generate_summary(f"sidebet_sim_summary_{timestamp}.txt")
-                # Generate the new detailed push matrix
-                report_generator.generate_detailed_push_matrix_csv(f"sidebet_push_matrix_{timestamp}.csv")
+                os.makedirs(RESULTS_DIR, exist_ok=True)
+                # Report files are independent, so write them concurrently
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = [
+                        executor.submit(report_generator.generate_detailed_csv, f"sidebet_sim_detailed_{timestamp}.csv"),
+                        executor.submit(report_generator.generate_matrix_csv, f"sidebet_sim_matrix_{timestamp}.csv"),
+                        executor.submit(report_generator.generate_summary, f"sidebet_sim_summary_{timestamp}.txt"),
+                        # Generate the new detailed push matrix
+                        executor.submit(report_generator.generate_detailed_push_matrix_csv, f"sidebet_push_matrix_{timestamp}.csv"),
+                    ]
+                    for future in futures:
+                        future.result()
             
             # Display results
             st.success(f"Simulation completed! {num_hands} hands simulated in {simulation_time:.2f} seconds.")
@@ -1480,23 +1606,12 @@ with tab3:
                 
                 # Plot the push distribution by value
                 if generate_visuals:
-                    fig, ax = plt.subplots(figsize=(10, 6))
-                    values = [str(v) for v in pushes_by_value.keys()]
-                    counts = list(pushes_by_value.values())
-                    
-                    bars = ax.bar(values, counts)
-                    
-                    # Add value labels on top of bars
-                    for bar in bars:
-                        height = bar.get_height()
-                        ax.text(bar.get_x() + bar.get_width()/2., height,
-                                f'{height}',
-                                ha='center', va='bottom')
-                    
-                    ax.set_xlabel('Hand Value')
-                    ax.set_ylabel('Number of Pushes')
-                    ax.set_title('Push Distribution by Hand Value')
-                    st.pyplot(fig)
+                    st.markdown("#### Push Distribution by Hand Value")
+                    st.bar_chart(pd.Series(
+                        list(pushes_by_value.values()),
+                        index=[str(v) for v in pushes_by_value.keys()],
+                        name="Number of Pushes"
+                    ))
             else:
                 # Create a table for push breakdown by card count
                 pushes_by_cards = results['pushes_by_card_count']
@@ -1518,23 +1633,12 @@ with tab3:
                 
                 # Plot the push distribution by card count
                 if generate_visuals:
-                    fig, ax = plt.subplots(figsize=(10, 6))
-                    cards = [str(c) for c in pushes_by_cards.keys()]
-                    counts = list(pushes_by_cards.values())
-                    
-                    bars = ax.bar(cards, counts)
-                    
-                    # Add value labels on top of bars
-                    for bar in bars:
-                        height = bar.get_height()
-                        ax.text(bar.get_x() + bar.get_width()/2., height,
-                                f'{height}',
-                                ha='center', va='bottom')
-                    
-                    ax.set_xlabel('Total Cards')
-                    ax.set_ylabel('Number of Pushes')
-                    ax.set_title('Push Distribution by Card Count')
-                    st.pyplot(fig)
+                    st.markdown("#### Push Distribution by Card Count")
+                    st.bar_chart(pd.Series(
+                        list(pushes_by_cards.values()),
+                        index=[str(c) for c in pushes_by_cards.keys()],
+                        name="Number of Pushes"
+                    ))
             
             if save_results:
                 st.info(f"""
@@ -2086,16 +2190,11 @@ with tab4:
         viz_type = st.selectbox("Select Visualization", viz_options)
         
         if viz_type == "Hand Outcomes":
-            fig, ax = plt.subplots(figsize=(10, 6))
-            outcomes = detailed_df["result"].value_counts().reset_index()
+            outcomes = st.session_state.latest_results["outcome_counts"].reset_index()
             outcomes.columns = ["Outcome", "Count"]
             
-            sns.barplot(x="Outcome", y="Count", data=outcomes, palette="viridis", ax=ax)
-            ax.set_title("Distribution of Hand Outcomes")
-            ax.set_ylabel("Number of Hands")
-            ax.tick_params(axis='x', rotation=45)
-            
-            st.pyplot(fig)
+            st.markdown("#### Distribution of Hand Outcomes")
+            st.bar_chart(outcomes.set_index("Outcome"))
             
             st.dataframe(
                 outcomes.assign(Percentage=lambda x: (x["Count"] / x["Count"].sum() * 100).round(2)).assign(
@@ -2104,6 +2203,7 @@ with tab4:
             )
             
         elif viz_type == "Total Value Distribution":
+            plt, sns = _plotting_libs()
             fig, ax = plt.subplots(1, 2, figsize=(15, 6))
             
             sns.histplot(detailed_df["player_total"], kde=True, bins=20, ax=ax[0])
@@ -2116,8 +2216,10 @@ with tab4:
             
             plt.tight_layout()
             st.pyplot(fig)
+            plt.close(fig)
             
         elif viz_type == "Win/Loss by Player Total":
+            plt, sns = _plotting_libs()
             fig, ax = plt.subplots(figsize=(12, 7))
             
             pivot_data = detailed_df.pivot_table(
@@ -2137,10 +2239,9 @@ with tab4:
             
             plt.tight_layout()
             st.pyplot(fig)
+            plt.close(fig)
             
         elif viz_type == "Dealer Bust Analysis":
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
             dealer_busts = detailed_df[detailed_df["dealer_total"] > 21]
             
             if len(dealer_busts) > 0:
@@ -2155,12 +2256,15 @@ with tab4:
                     bust_analysis = pd.merge(bust_by_upcard, total_by_upcard, on="Dealer Upcard")
                     bust_analysis["Bust Percentage"] = (bust_analysis["Bust Count"] / bust_analysis["Total Count"] * 100).round(2)
                     
+                    plt, sns = _plotting_libs()
+                    fig, ax = plt.subplots(figsize=(10, 6))
                     sns.barplot(x="Dealer Upcard", y="Bust Percentage", data=bust_analysis, palette="viridis", ax=ax)
                     ax.set_title("Dealer Bust Percentage by Upcard")
                     ax.set_ylabel("Bust Percentage (%)")
                     
                     plt.tight_layout()
                     st.pyplot(fig)
+                    plt.close(fig)
                     
                     st.dataframe(bust_analysis)
                 else:
@@ -2171,51 +2275,78 @@ with tab4:
                 st.info("No dealer busts found in this simulation.")
         
         elif viz_type == "Outcome Matrix Heatmap":
-            matrix_df = pd.crosstab(
-                detailed_df["player_total"], 
-                detailed_df["dealer_total"], 
-                values=detailed_df["result"].apply(lambda x: 1 if x == "Win" else (0 if x == "Push" else -1)),
-                aggfunc="mean"
-            ).fillna(0)
-            
-            fig, ax = plt.subplots(figsize=(12, 8))
-            sns.heatmap(
-                matrix_df, 
-                annot=True, 
-                cmap="RdYlGn", 
-                center=0, 
-                ax=ax,
-                fmt=".2f"
-            )
-            ax.set_title("Player vs Dealer Total Outcome Matrix\n(1=Player Win, 0=Push, -1=Dealer Win)")
-            ax.set_xlabel("Dealer Total")
-            ax.set_ylabel("Player Total")
-            
-            plt.tight_layout()
-            st.pyplot(fig)
-            
-            st.write("##### Hand Total Frequency Matrix")
-            freq_matrix = pd.crosstab(
-                detailed_df["player_total"], 
-                detailed_df["dealer_total"]
-            )
+            matrix_df = st.session_state.latest_results["outcome_score_pivot"]
+            freq_matrix = st.session_state.latest_results["matrix_pivot"]
             
-            fig2, ax2 = plt.subplots(figsize=(12, 8))
-            sns.heatmap(
-                freq_matrix, 
-                annot=True, 
-                cmap="YlGnBu", 
-                ax=ax2
-            )
-            ax2.set_title("Frequency of Player vs Dealer Hand Totals")
-            ax2.set_xlabel("Dealer Total")
-            ax2.set_ylabel("Player Total")
-            
-            plt.tight_layout()
-            st.pyplot(fig2)
+            try:
+                import plotly.express as px
+            except ImportError:
+                px = None
+            
+            if px is not None:
+                # plotly renders the heatmaps in the browser, so no matplotlib figure is built per rerun
+                st.plotly_chart(
+                    px.imshow(
+                        matrix_df,
+                        color_continuous_scale="RdYlGn",
+                        color_continuous_midpoint=0,
+                        text_auto=".2f",
+                        labels=dict(x="Dealer Total", y="Player Total", color="Outcome"),
+                        title="Player vs Dealer Total Outcome Matrix (1=Player Win, 0=Push, -1=Dealer Win)"
+                    ),
+                    use_container_width=True
+                )
+                
+                st.write("##### Hand Total Frequency Matrix")
+                st.plotly_chart(
+                    px.imshow(
+                        freq_matrix,
+                        color_continuous_scale="YlGnBu",
+                        text_auto=True,
+                        labels=dict(x="Dealer Total", y="Player Total", color="Count"),
+                        title="Frequency of Player vs Dealer Hand Totals"
+                    ),
+                    use_container_width=True
+                )
+            else:
+                plt, sns = _plotting_libs()
+                fig, ax = plt.subplots(figsize=(12, 8))
+                sns.heatmap(
+                    matrix_df, 
+                    annot=True, 
+                    cmap="RdYlGn", 
+                    center=0, 
+                    ax=ax,
+                    fmt=".2f"
+                )
+                ax.set_title("Player vs Dealer Total Outcome Matrix\n(1=Player Win, 0=Push, -1=Dealer Win)")
+                ax.set_xlabel("Dealer Total")
+                ax.set_ylabel("Player Total")
+                
+                plt.tight_layout()
+                st.pyplot(fig)
+                plt.close(fig)
+                
+                st.write("##### Hand Total Frequency Matrix")
+                
+                fig2, ax2 = plt.subplots(figsize=(12, 8))
+                sns.heatmap(
+                    freq_matrix, 
+                    annot=True, 
+                    cmap="YlGnBu", 
+                    ax=ax2
+                )
+                ax2.set_title("Frequency of Player vs Dealer Hand Totals")
+                ax2.set_xlabel("Dealer Total")
+                ax2.set_ylabel("Player Total")
+                
+                plt.tight_layout()
+                st.pyplot(fig2)
+                plt.close(fig2)
             
         elif viz_type == "Player vs Dealer Total Comparison":
             # Create violin plot comparing player and dealer totals
+            plt, sns = _plotting_libs()
             fig, ax = plt.subplots(figsize=(10, 6))
             
             # Create a new dataframe for the violin plot
@@ -2230,6 +2361,7 @@ with tab4:
             
             plt.tight_layout()
             st.pyplot(fig)
+            plt.close(fig)
             
             # Additional statistics
             st.write("##### Hand Total Statistics")
@@ -2255,45 +2387,50 @@ with tab4:
             
             # Filtering options
             with st.expander("Data Filtering"):
-                # Outcome filter
-                outcome_filter = st.multiselect(
-                    "Filter by outcome:", 
-                    options=sorted(detailed_df["result"].unique()),
-                    default=[]
-                )
+                # Filters are only applied on submit so dragging a slider does not rerun the plots
+                with st.form("custom_analysis_filters"):
+                    # Outcome filter
+                    outcome_filter = st.multiselect(
+                        "Filter by outcome:", 
+                        options=sorted(detailed_df["result"].unique()),
+                        default=[]
+                    )
                 
-                # Player total range
-                player_min = int(detailed_df["player_total"].min())
-                player_max = int(detailed_df["player_total"].max())
-                player_range = st.slider(
-                    "Player total range:", 
-                    min_value=player_min,
-                    max_value=player_max,
-                    value=(player_min, player_max)
-                )
+                    # Player total range
+                    player_min = int(detailed_df["player_total"].min())
+                    player_max = int(detailed_df["player_total"].max())
+                    player_range = st.slider(
+                        "Player total range:", 
+                        min_value=player_min,
+                        max_value=player_max,
+                        value=(player_min, player_max)
+                    )
                 
-                # Dealer total range
-                dealer_min = int(detailed_df["dealer_total"].min())
-                dealer_max = int(detailed_df["dealer_total"].max())
-                dealer_range = st.slider(
-                    "Dealer total range:", 
-                    min_value=dealer_min,
-                    max_value=dealer_max,
-                    value=(dealer_min, dealer_max)
-                )
+                    # Dealer total range
+                    dealer_min = int(detailed_df["dealer_total"].min())
+                    dealer_max = int(detailed_df["dealer_total"].max())
+                    dealer_range = st.slider(
+                        "Dealer total range:", 
+                        min_value=dealer_min,
+                        max_value=dealer_max,
+                        value=(dealer_min, dealer_max)
+                    )
+                
+                    st.form_submit_button("Apply filters")
+                
+                # Apply filters as a single mask; rows are only selected, never mutated
+                player_totals = detailed_df["player_total"].to_numpy()
+                dealer_totals = detailed_df["dealer_total"].to_numpy()
                 
-                # Apply filters
-                filtered_df = detailed_df.copy()
+                mask = player_totals >= player_range[0]
+                mask &= player_totals <= player_range[1]
+                mask &= dealer_totals >= dealer_range[0]
+                mask &= dealer_totals <= dealer_range[1]
                 
                 if outcome_filter:
-                    filtered_df = filtered_df[filtered_df["result"].isin(outcome_filter)]
+                    mask &= detailed_df["result"].isin(set(outcome_filter)).to_numpy()
                 
-                filtered_df = filtered_df[
-                    (filtered_df["player_total"] >= player_range[0]) & 
-                    (filtered_df["player_total"] <= player_range[1]) &
-                    (filtered_df["dealer_total"] >= dealer_range[0]) & 
-                    (filtered_df["dealer_total"] <= dealer_range[1])
-                ]
+                filtered_df = detailed_df[mask]
                 
                 st.write(f"Filtered data contains {len(filtered_df)} hands")
             
@@ -2308,6 +2445,7 @@ with tab4:
                 ["Bar Chart", "Scatter Plot", "Line Chart", "Histogram", "Box Plot", "Violin Plot", "Heatmap"]
             )
             
+            plt, sns = _plotting_libs()
             fig, ax = plt.subplots(figsize=(10, 6))
             
             if plot_type == "Bar Chart":
@@ -2350,6 +2488,7 @@ with tab4:
             
             plt.tight_layout()
             st.pyplot(fig)
+            plt.close(fig)
             
             # Show filtered data
             with st.expander("View Filtered Data"):
@@ -2385,31 +2524,28 @@ with tab5:
                 st.markdown('<div class="result-container">', unsafe_allow_html=True)
                 st.markdown(f"### Summary for Simulation {timestamp}")
                 
-                results_dir = "results"
-                summary_path = os.path.join(results_dir, selected_result['summary_file'])
-                if os.path.exists(summary_path):
-                    with open(summary_path, 'r') as f:
-                        summary_content = f.read()
-                    st.text(summary_content)
+                summary_path = os.path.join(RESULTS_DIR, selected_result['summary_file'])
+                try:
+                    st.text(Path(summary_path).read_text())
+                except FileNotFoundError:
+                    pass
                 
                 st.markdown('</div>', unsafe_allow_html=True)
             
             # Check for corresponding config file
             config_file = selected_result['config_file']
             if config_file:
-                config_path = os.path.join("config", config_file)
-                if os.path.exists(config_path):
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                    
+                config = _read_config(os.path.join(CONFIG_DIR, config_file))
+                if config is not None:
                     st.markdown("### Simulation Configuration")
                     st.json(config)
             
             # Analysis of selected simulation
             if selected_result['detailed_file']:
-                detailed_path = os.path.join("results", selected_result['detailed_file'])
+                detailed_path = os.path.join(RESULTS_DIR, selected_result['detailed_file'])
                 if os.path.exists(detailed_path):
-                    detailed_df = pd.read_csv(detailed_path)
+                    detailed_mtime_ns = _path_mtime_ns(detailed_path)
+                    detailed_df = _load_detailed_csv(detailed_path, detailed_mtime_ns)
                     
                     st.markdown("### Visualization")
                     
@@ -2421,18 +2557,13 @@ with tab5:
                     )
                     
                     if past_viz_type == "Hand Outcomes":
-                        fig, ax = plt.subplots(figsize=(10, 6))
-                        outcomes = detailed_df["result"].value_counts().reset_index()
-                        outcomes.columns = ["Outcome", "Count"]
+                        outcomes = _outcome_counts(detailed_path, detailed_mtime_ns)
                         
-                        sns.barplot(x="Outcome", y="Count", data=outcomes, palette="viridis", ax=ax)
-                        ax.set_title("Distribution of Hand Outcomes")
-                        ax.set_ylabel("Number of Hands")
-                        ax.tick_params(axis='x', rotation=45)
-                        
-                        st.pyplot(fig)
+                        st.markdown("#### Distribution of Hand Outcomes")
+                        st.bar_chart(outcomes.set_index("Outcome"))
                     
                     elif past_viz_type == "Total Value Distribution":
+                        plt, sns = _plotting_libs()
                         fig, ax = plt.subplots(1, 2, figsize=(15, 6))
                         
                         # Player totals
@@ -2447,20 +2578,14 @@ with tab5:
                         
                         plt.tight_layout()
                         st.pyplot(fig)
+                        plt.close(fig)
                     
                     elif past_viz_type == "Win/Loss Analysis":
+                        plt, sns = _plotting_libs()
                         fig, ax = plt.subplots(figsize=(12, 7))
                         
-                        # Create a pivot table of outcomes by player total
-                        pivot_data = detailed_df.pivot_table(
-                            index="player_total", 
-                            columns="result", 
-                            aggfunc="size", 
-                            fill_value=0
-                        )
-                        
-                        # Convert to percentages
-                        pivot_pct = pivot_data.div(pivot_data.sum(axis=1), axis=0) * 100
+                        # Percentage of outcomes by player total
+                        pivot_pct = _outcome_pct_by_player_total(detailed_path, detailed_mtime_ns)
                         
                         # Plot stacked bar chart
                         pivot_pct.plot(kind="bar", stacked=True, ax=ax, colormap="viridis")
@@ -2471,11 +2596,10 @@ with tab5:
                         
                         plt.tight_layout()
                         st.pyplot(fig)
+                        plt.close(fig)
                     
                     elif past_viz_type == "Dealer Bust Analysis":
                         # Similar to above dealer bust analysis
-                        fig, ax = plt.subplots(figsize=(10, 6))
-                        
                         # Filter for dealer busts
                         dealer_busts = detailed_df[detailed_df["dealer_total"] > 21]
                         
@@ -2494,12 +2618,15 @@ with tab5:
                                 bust_analysis["Bust Percentage"] = (bust_analysis["Bust Count"] / bust_analysis["Total Count"] * 100).round(2)
                                 
                                 # Plot
+                                plt, sns = _plotting_libs()
+                                fig, ax = plt.subplots(figsize=(10, 6))
                                 sns.barplot(x="Dealer Upcard", y="Bust Percentage", data=bust_analysis, palette="viridis", ax=ax)
                                 ax.set_title("Dealer Bust Percentage by Upcard")
                                 ax.set_ylabel("Bust Percentage (%)")
                                 
                                 plt.tight_layout()
                                 st.pyplot(fig)
+                                plt.close(fig)
                                 
                                 # Show the raw data
                                 st.dataframe(bust_analysis)
@@ -2518,11 +2645,12 @@ with tab5:
             col1, col2 = st.columns(2)
             
             if detailed_csv:
-                detailed_path = os.path.join("results", detailed_csv)
-                if os.path.exists(detailed_path):
+                try:
+                    csv_content = Path(RESULTS_DIR, detailed_csv).read_bytes()
+                except FileNotFoundError:
+                    csv_content = None
+                if csv_content is not None:
                     with col1:
-                        with open(detailed_path, "r") as f:
-                            csv_content = f.read()
                         st.download_button(
                             label="Download Detailed CSV",
                             data=csv_content,
@@ -2531,11 +2659,12 @@ with tab5:
                         )
             
             if matrix_csv:
-                matrix_path = os.path.join("results", matrix_csv)
-                if os.path.exists(matrix_path):
+                try:
+                    csv_content = Path(RESULTS_DIR, matrix_csv).read_bytes()
+                except FileNotFoundError:
+                    csv_content = None
+                if csv_content is not None:
                     with col2:
-                        with open(matrix_path, "r") as f:
-                            csv_content = f.read()
                         st.download_button(
                             label="Download Matrix CSV",
                             data=csv_content,
@@ -2564,26 +2693,23 @@ with tab5:
                         # Get config
                         config_data = {}
                         if sim_result['config_file']:
-                            config_path = os.path.join("config", sim_result['config_file'])
-                            if os.path.exists(config_path):
-                                with open(config_path, "r") as f:
-                                    config_data = json.load(f)
+                            config_data = _read_config(os.path.join(CONFIG_DIR, sim_result['config_file'])) or {}
                         
                         # Load detailed results for metrics
                         sim_metrics = {"timestamp": sim_timestamp, "config": config_data}
                         
                         if sim_result['detailed_file']:
-                            detailed_path = os.path.join("results", sim_result['detailed_file'])
+                            detailed_path = os.path.join(RESULTS_DIR, sim_result['detailed_file'])
                             if os.path.exists(detailed_path):
-                                df = pd.read_csv(detailed_path)
+                                counts = _detailed_counts(detailed_path, _path_mtime_ns(detailed_path))
                                 
                                 # Calculate metrics
-                                total_hands = len(df)
-                                player_wins = len(df[df["result"] == "Win"])
-                                dealer_wins = len(df[df["result"] == "Loss"])
-                                pushes = len(df[df["result"] == "Push"])
-                                player_busts = len(df[df["player_total"] > 21])
-                                dealer_busts = len(df[df["dealer_total"] > 21])
+                                total_hands = counts["total_hands"]
+                                player_wins = counts["player_wins"]
+                                dealer_wins = counts["dealer_wins"]
+                                pushes = counts["pushes"]
+                                player_busts = counts["player_busts"]
+                                dealer_busts = counts["dealer_busts"]
                                 
                                 # Add metrics to data
                                 sim_metrics.update({
@@ -2642,6 +2768,7 @@ with tab5:
                                 "push_rate", "player_bust_rate", "dealer_bust_rate"]
                     )
                     
+                    plt, sns = _plotting_libs()
                     fig, ax = plt.subplots(figsize=(10, 6))
                     
                     # Create bar chart with simulation labels
@@ -2674,6 +2801,7 @@ with tab5:
                     plt.tight_layout()
                     
                     st.pyplot(fig)
+                    plt.close(fig)
     else:
         st.info("No previous simulation results found. Run simulations with 'Save Results' enabled to store them.")
 
@@ -0,0 +1,74 @@
+import copy
+import unittest
+
+from src.simulation.config import SimulationConfig
+from src.simulation.simulator import BlackjackSimulator
+from src.simulation.sidebet_simulator import SidebetSimulator
+
+
+def _serial_chunks(simulator_cls, config, n_workers, seed):
+    """Run the chunks run_simulation_parallel would hand its workers, one after another."""
+    base_hands, extra_hands = divmod(config.num_hands, n_workers)
+    chunk_results = []
+    for i in range(n_workers):
+        chunk_config = copy.copy(config)
+        chunk_config.num_hands = base_hands + (1 if i < extra_hands else 0)
+        simulator = simulator_cls(chunk_config, seed=seed + i)
+        chunk_results.append(simulator.run_simulation(report_progress=False))
+    return chunk_results
+
+
+class ParallelSimulationTest(unittest.TestCase):
+    SEED = 1234
+
+    def assert_counters_summed(self, parallel, chunk_results, derived):
+        for key, total in parallel.items():
+            if key in derived:
+                continue
+            if isinstance(total, dict):
+                expected = {}
+                for chunk in chunk_results:
+                    for sub_key, count in chunk[key].items():
+                        expected[sub_key] = expected.get(sub_key, 0) + count
+                self.assertEqual(total, expected, key)
+            else:
+                self.assertEqual(total, sum(chunk[key] for chunk in chunk_results), key)
+
+    def test_sidebet_parallel_matches_seeded_serial_runs(self):
+        config = SimulationConfig(num_hands=3001)
+        parallel = SidebetSimulator(config, seed=self.SEED).run_simulation_parallel(
+            2, report_progress=False)
+        chunk_results = _serial_chunks(SidebetSimulator, config, 2, self.SEED)
+
+        self.assertEqual(parallel['total_bets'], 3001)
+        self.assert_counters_summed(parallel, chunk_results, SidebetSimulator.DERIVED_RESULTS)
+
+        # Edges come from the summed counters, not from adding the chunks' edges
+        self.assertAlmostEqual(
+            parallel['sidebet_edge'],
+            (parallel['sidebet_payouts'] - 3001) / 3001 * 100)
+        self.assertAlmostEqual(
+            parallel['house_edge'], -parallel['net_win_amount'] / 3001 * 100)
+
+    def test_main_parallel_matches_seeded_serial_runs(self):
+        config = SimulationConfig(num_hands=3001)
+        parallel = BlackjackSimulator(config, seed=self.SEED).run_simulation_parallel(
+            2, report_progress=False)
+        chunk_results = _serial_chunks(BlackjackSimulator, config, 2, self.SEED)
+
+        self.assertEqual(parallel['total_bets'], 3001)
+        self.assert_counters_summed(parallel, chunk_results, BlackjackSimulator.DERIVED_RESULTS)
+
+    def test_single_worker_matches_serial_run(self):
+        config = SimulationConfig(num_hands=500)
+        parallel = SidebetSimulator(config, seed=self.SEED).run_simulation_parallel(
+            1, report_progress=False)
+        serial = SidebetSimulator(config, seed=self.SEED).run_simulation(report_progress=False)
+
+        parallel.pop('simulation_time')
+        serial.pop('simulation_time')
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()